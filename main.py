@@ -5,6 +5,9 @@ YouTube New Video Bot - Refactored
 A clean, maintainable YouTube video notification bot following SOLID principles.
 """
 
+import logging
+import logging.handlers
+import queue
 import sys
 from src.config.settings import BotConfig
 from src.services.bot_service import YouTubeBotService
@@ -20,6 +23,14 @@ def main() -> None:
     """Main entry point."""
     # validate_python_version()
 
+    # Plain messages on stdout, as the services' log lines carry their own [tag] prefix.
+    # Records are queued and written by a listener thread, so polling threads never block on stdout.
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(level=logging.INFO, format="%(message)s",
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log_listener.start()
+
     try:
         # Load and validate configuration
         config = BotConfig.from_env()
@@ -38,6 +49,9 @@ def main() -> None:
     except Exception as e:
         print(f"Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        # Flush queued records before exiting
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -6,10 +6,13 @@ This shows how to use the new notify field to control which channels
 send notifications locally, since YouTube API doesn't expose bell settings.
 """
 
+import logging
 import sys
 from src.config.settings import BotConfig
 from src.services.bot_service import YouTubeBotService
 
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
 
 def demonstrate_notification_preferences():
     """Demonstrate how to manage notification preferences."""
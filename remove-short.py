@@ -9,18 +9,26 @@ This includes YouTube Shorts and other non-standard video formats.
 
 import os
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from google.cloud.firestore_v1.base_query import FieldFilter
 from src.services.firebase_service import FirebaseService
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Firestore allows at most 500 writes per batch
+DELETE_BATCH_SIZE = 500
+
+FULL_VIDEO_PREFIX = "https://www.youtube.com/watch?v="
+# Sorts after every character that can follow the prefix in a URL
+PREFIX_RANGE_END = FULL_VIDEO_PREFIX + "\uf8ff"
+
 
 def is_full_youtube_video(video_data: Dict[str, Any]) -> bool:
     """Check if video has full YouTube watch URL format (not a short)."""
@@ -29,44 +37,75 @@ def is_full_youtube_video(video_data: Dict[str, Any]) -> bool:
         return False
     
     # Check if the URL matches the full YouTube watch format
-    return link.startswith("https://www.youtube.com/watch?v=")
+    return link.startswith(FULL_VIDEO_PREFIX)
 
 
-def get_all_videos(firebase_service: FirebaseService) -> List[Dict[str, Any]]:
-    """Get all videos from Firestore."""
+def scan_videos(firebase_service: FirebaseService) -> Tuple[int, int, List[Dict[str, Any]]]:
+    """Query the videos collection. Returns (total, full video count, short videos).
+
+    Full videos are only counted server-side; just the documents whose link falls
+    outside the watch-URL prefix range are downloaded. Documents without a link
+    field do not match any range filter and are left untouched.
+    """
     if not firebase_service._db:
-        return []
+        return 0, 0, []
     
     try:
-        print("[remove-short] Fetching all videos from Firestore...")
-        docs = firebase_service._db.collection('videos').get()
-        videos = []
-        
-        for doc in docs:
-            video_data = doc.to_dict()
-            video_data['doc_id'] = doc.id  # Store document ID
-            videos.append(video_data)
-        
-        print(f"[remove-short] Found {len(videos)} total videos in Firestore")
-        return videos
+        print("[remove-short] Scanning videos in Firestore...")
+        videos_ref = firebase_service._db.collection('videos')
+
+        full_query = (videos_ref
+                      .where(filter=FieldFilter('link', '>=', FULL_VIDEO_PREFIX))
+                      .where(filter=FieldFilter('link', '<', PREFIX_RANGE_END)))
+        full_count = int(full_query.count().get()[0][0].value)
+
+        short_queries = [
+            videos_ref.where(filter=FieldFilter('link', '<', FULL_VIDEO_PREFIX)),
+            videos_ref.where(filter=FieldFilter('link', '>=', PREFIX_RANGE_END)),
+        ]
+        short_videos = []
+        for query in short_queries:
+            # Only the fields used for filtering and reporting are downloaded
+            for doc in query.select(['link', 'title']).stream():
+                video_data = doc.to_dict()
+                if is_full_youtube_video(video_data):
+                    continue
+                video_data['doc_id'] = doc.id  # Store document ID
+                short_videos.append(video_data)
+
+        total_count = full_count + len(short_videos)
+        print(f"[remove-short] Found {total_count} total videos in Firestore")
+        return total_count, full_count, short_videos
         
     except Exception as e:
         print(f"[remove-short] Error fetching videos: {e}")
-        return []
+        return 0, 0, []
 
 
-def delete_video(firebase_service: FirebaseService, doc_id: str, title: str) -> bool:
-    """Delete a video from Firestore."""
+def delete_videos(firebase_service: FirebaseService, videos: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Delete videos from Firestore in batches. Returns (deleted, failed) counts."""
     if not firebase_service._db:
-        return False
-    
-    try:
-        firebase_service._db.collection('videos').document(doc_id).delete()
-        print(f"[remove-short] Deleted: {title[:50]}{'...' if len(title) > 50 else ''}")
-        return True
-    except Exception as e:
-        print(f"[remove-short] Error deleting video {doc_id}: {e}")
-        return False
+        return 0, len(videos)
+
+    videos_ref = firebase_service._db.collection('videos')
+    deleted_count = 0
+    failed_count = 0
+
+    for start in range(0, len(videos), DELETE_BATCH_SIZE):
+        chunk = videos[start:start + DELETE_BATCH_SIZE]
+        batch = firebase_service._db.batch()
+        for video in chunk:
+            batch.delete(videos_ref.document(video['doc_id']))
+
+        try:
+            batch.commit()
+            deleted_count += len(chunk)
+            print(f"[remove-short] [{start + len(chunk)}/{len(videos)}] Deleted batch of {len(chunk)} videos")
+        except Exception as e:
+            failed_count += len(chunk)
+            print(f"[remove-short] Error deleting batch starting at {start + 1}: {e}")
+
+    return deleted_count, failed_count
 
 
 def main():
@@ -95,24 +134,14 @@ def main():
         print(f"[remove-short] Error initializing Firebase: {e}")
         sys.exit(1)
     
-    # Get all videos
-    all_videos = get_all_videos(firebase_service)
-    if not all_videos:
+    # Scan and analyze videos
+    total_count, full_count, short_videos = scan_videos(firebase_service)
+    if not total_count:
         print("[remove-short] No videos found or error occurred. Exiting.")
         return
     
-    # Analyze videos
-    full_videos = []
-    short_videos = []
-    
-    for video in all_videos:
-        if is_full_youtube_video(video):
-            full_videos.append(video)
-        else:
-            short_videos.append(video)
-    
     print(f"\n[remove-short] Video Analysis:")
-    print(f"  - Full YouTube videos: {len(full_videos)}")
+    print(f"  - Full YouTube videos: {full_count}")
     print(f"  - Shorts/non-standard videos: {len(short_videos)}")
     
     if not short_videos:
@@ -146,21 +175,9 @@ def main():
     
     # Delete shorts
     print(f"\n[remove-short] Starting deletion of {len(short_videos)} shorts...")
-    deleted_count = 0
-    failed_count = 0
-    
     start_time = datetime.now()
     
-    for i, video in enumerate(short_videos, 1):
-        doc_id = video['doc_id']
-        title = video.get('title', 'Unknown Title')
-        
-        print(f"[remove-short] [{i}/{len(short_videos)}] ", end="")
-        
-        if delete_video(firebase_service, doc_id, title):
-            deleted_count += 1
-        else:
-            failed_count += 1
+    deleted_count, failed_count = delete_videos(firebase_service, short_videos)
     
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
@@ -172,7 +189,7 @@ def main():
     print(f"Total videos processed: {len(short_videos)}")
     print(f"Successfully deleted: {deleted_count}")
     print(f"Failed to delete: {failed_count}")
-    print(f"Remaining full videos: {len(full_videos)}")
+    print(f"Remaining full videos: {full_count}")
     print(f"Operation duration: {duration:.2f} seconds")
     print("=" * 60)
     
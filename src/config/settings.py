@@ -1,13 +1,35 @@
 """Configuration management for YouTube Video Bot."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
 from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from dotenv import load_dotenv
 from croniter import croniter
 
 load_dotenv()
 
+_YOUTUBE_SCOPES = ("https://www.googleapis.com/auth/youtube.readonly",)
+
+# Values accepted as "on" for boolean environment variables
+_TRUTHY = frozenset(("1", "true", "yes", "y"))
+
+
+def _local_timezone() -> tzinfo:
+    """The system time zone, as a named zone so its DST rules apply."""
+    name = os.getenv("TZ", "").lstrip(":")
+    if not name:
+        # /etc/localtime is normally a link into the zoneinfo database
+        name = os.path.realpath("/etc/localtime").partition("zoneinfo/")[2]
+    if name:
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    # No named zone to be found: fall back to the current fixed offset
+    return datetime.now().astimezone().tzinfo
+
 
 @dataclass(frozen=True)
 class BotConfig:
@@ -23,7 +45,7 @@ class BotConfig:
     firebase_credentials_file: str
     
     # API scopes
-    youtube_scopes: list[str]
+    youtube_scopes: tuple[str, ...]
     
     # Timing configuration
     video_cron: str
@@ -44,6 +66,19 @@ class BotConfig:
     oauth_ssl_cert_path: Optional[str]
     oauth_ssl_key_path: Optional[str]
     
+    # WebSub push configuration (disabled when no callback URL is set)
+    websub_callback_url: Optional[str]
+    websub_port: int
+    websub_secret: Optional[str]
+    
+    # IANA zone the cron expressions are evaluated in (None means the system zone)
+    cron_timezone: Optional[str] = None
+    
+    # Cron schedules compiled by validate(); the scheduler starts them from its own start time
+    video_cron_iter: Optional[croniter] = field(default=None, init=False, repr=False, compare=False)
+    channel_cron_iter: Optional[croniter] = field(default=None, init=False, repr=False, compare=False)
+    summary_cron_iter: Optional[croniter] = field(default=None, init=False, repr=False, compare=False)
+    
     @classmethod
     def from_env(cls) -> "BotConfig":
         """Create configuration from environment variables."""
@@ -63,35 +98,47 @@ class BotConfig:
             youtube_client_secret_file=os.getenv("YOUTUBE_CLIENT_SECRET_FILE", "youtube-client-secret.json"),
             youtube_token_file=os.getenv("YOUTUBE_TOKEN_FILE", "youtube-token.json"),
             firebase_credentials_file=os.getenv("FIREBASE_CREDENTIALS_FILE", "firebase-service-account.json"),
-            youtube_scopes=["https://www.googleapis.com/auth/youtube.readonly"],
+            youtube_scopes=_YOUTUBE_SCOPES,
             video_cron=os.getenv("VIDEO_CRON", "0 * * * *"),        # Every hour
             channel_cron=os.getenv("CHANNEL_CRON", "0 0 * * *"),   # Daily at midnight
             summary_cron=os.getenv("SUMMARY_CRON", "0 16 * * *"),  # Daily at 00:00 UTC+8 (16:00 UTC)
-            init_mode=os.getenv("INIT_MODE", "false").lower() in ("1", "true", "yes", "y"),
+            init_mode=os.getenv("INIT_MODE", "false").lower() in _TRUTHY,
             upstash_redis_url=upstash_redis_url,
             app_name=os.getenv("APP_NAME", "youtube-bot"),
             oauth_port=int(os.getenv("OAUTH_PORT", os.getenv("OAUTH_PORT_START", "8080"))),  # Support both for backward compatibility
             oauth_timeout=int(os.getenv("OAUTH_TIMEOUT", "300")),
-            oauth_auto_browser=os.getenv("OAUTH_AUTO_BROWSER", "true").lower() in ("1", "true", "yes", "y"),
+            oauth_auto_browser=os.getenv("OAUTH_AUTO_BROWSER", "true").lower() in _TRUTHY,
             oauth_callback_domain=os.getenv("OAUTH_CALLBACK_DOMAIN"),  # None means localhost
-            oauth_use_ssl=os.getenv("OAUTH_USE_SSL", "false").lower() in ("1", "true", "yes", "y"),
+            oauth_use_ssl=os.getenv("OAUTH_USE_SSL", "false").lower() in _TRUTHY,
             oauth_ssl_cert_path=os.getenv("OAUTH_SSL_CERT_PATH"),
-            oauth_ssl_key_path=os.getenv("OAUTH_SSL_KEY_PATH")
+            oauth_ssl_key_path=os.getenv("OAUTH_SSL_KEY_PATH"),
+            websub_callback_url=os.getenv("WEBSUB_CALLBACK_URL") or None,
+            websub_port=int(os.getenv("WEBSUB_PORT", "8081")),
+            websub_secret=os.getenv("WEBSUB_SECRET") or None,
+            cron_timezone=os.getenv("CRON_TIMEZONE") or None
         )
     
     def validate(self) -> None:
-        """Validate configuration values."""
-        try:
-            croniter(self.video_cron)
-        except ValueError as e:
-            raise ValueError(f"Invalid VIDEO_CRON expression: {e}")
-        
+        """Validate configuration values and keep the compiled cron schedules."""
+        if self.websub_callback_url and not self.websub_secret:
+            # Without a secret anyone reaching the callback could push forged uploads
+            raise ValueError("WEBSUB_SECRET must be set when WEBSUB_CALLBACK_URL is set")
         try:
-            croniter(self.channel_cron)
-        except ValueError as e:
-            raise ValueError(f"Invalid CHANNEL_CRON expression: {e}")
-        
-        try:
-            croniter(self.summary_cron)
-        except ValueError as e:
-            raise ValueError(f"Invalid SUMMARY_CRON expression: {e}")
\ No newline at end of file
+            self.cron_tz()
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            raise ValueError(f"Invalid CRON_TIMEZONE: {e}")
+        for name, expression in (("video_cron", self.video_cron),
+                                 ("channel_cron", self.channel_cron),
+                                 ("summary_cron", self.summary_cron)):
+            try:
+                cron = croniter(expression)
+            except ValueError as e:
+                raise ValueError(f"Invalid {name.upper()} expression: {e}")
+            # Frozen dataclass: bypass __setattr__ to attach the parsed schedule
+            object.__setattr__(self, f"{name}_iter", cron)
+
+    def cron_tz(self) -> tzinfo:
+        """Time zone the cron expressions are evaluated in."""
+        if self.cron_timezone:
+            return ZoneInfo(self.cron_timezone)
+        return _local_timezone()
@@ -1,11 +1,18 @@
 """Channel-related data models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp; stored values rarely change between reloads."""
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class Channel:
     """Represents a YouTube channel subscription."""
 
@@ -15,16 +22,13 @@ class Channel:
     last_video_id: str = ""
     notify: bool = True  # Local preference for notifications
     last_upload_at: Optional[datetime] = None
+    # Derived URLs, built once from channel_id
+    link: str = field(init=False, repr=False, compare=False)
+    rss_url: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def link(self) -> str:
-        """Get YouTube channel URL."""
-        return f"https://www.youtube.com/channel/{self.channel_id}"
-
-    @property
-    def rss_url(self) -> str:
-        """Get RSS feed URL for this channel."""
-        return f"https://www.youtube.com/feeds/videos.xml?channel_id={self.channel_id}"
+    def __post_init__(self) -> None:
+        self.link = f"https://www.youtube.com/channel/{self.channel_id}"
+        self.rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={self.channel_id}"
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
@@ -53,26 +57,27 @@ class Channel:
 
     @classmethod
     def from_state_dict(cls, channel_id: str, data: dict) -> "Channel":
-        """Create Channel from state dictionary."""
-        last_upload_str = data.get("last_upload_at")
+        """Create Channel from state dictionary.
+
+        Called once per stored channel on every cache reload, so the constructor
+        is called positionally (channel_id, title, thumbnail, last_video_id,
+        notify, last_upload_at) with data.get bound once.
+        """
+        get = data.get
+        last_upload_str = get("last_upload_at")
         last_upload_at = None
         if last_upload_str:
             try:
-                last_upload_at = datetime.fromisoformat(last_upload_str)
-            except ValueError:
+                last_upload_at = _parse_iso(last_upload_str)
+            except (ValueError, TypeError):
                 last_upload_at = None
-        
-        return cls(
-            channel_id=channel_id,
-            title=data.get("title", channel_id),
-            thumbnail=data.get("thumbnail"),
-            last_video_id=data.get("last_video_id", ""),
-            notify=data.get("notify", True),  # Default to True for backward compatibility
-            last_upload_at=last_upload_at
-        )
+
+        # notify defaults to True for backward compatibility
+        return cls(channel_id, get("title", channel_id), get("thumbnail"),
+                   get("last_video_id", ""), get("notify", True), last_upload_at)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserChannelInfo:
     """Represents authenticated user's channel information."""
 
@@ -1,18 +1,40 @@
 """Video-related data models."""
 
+import io
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, Union
-from firebase_admin import firestore
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it at runtime pulls in gRPC/protobuf
+    from firebase_admin import firestore
 
-@dataclass(frozen=True)
+# Namespaces used by YouTube's Atom feeds
+ATOM_NS = {
+    "a": "http://www.w3.org/2005/Atom",
+    "yt": "http://www.youtube.com/xml/schemas/2015",
+    "media": "http://search.yahoo.com/mrss/",
+}
+
+_UTC = timezone.utc
+
+
+def iter_atom_entries(content: bytes) -> Iterator[ET.Element]:
+    """Yield the <entry> elements of a YouTube Atom feed as they are parsed."""
+    entry_tag = f"{{{ATOM_NS['a']}}}entry"
+    for _, element in ET.iterparse(io.BytesIO(content), events=("end",)):
+        if element.tag == entry_tag:
+            yield element
+
+
+@dataclass(frozen=True, slots=True)
 class Video:
     """Represents a YouTube video."""
 
     video_id: str
     title: str
-    channel_ref: Union[firestore.DocumentReference, str]
+    channel_ref: "Union[firestore.DocumentReference, str]"
     link: str
     thumbnail: Optional[str] = None
     published_at: Optional[str] = None
@@ -31,19 +53,25 @@ class Video:
         }
     
     @classmethod
-    def from_rss_entry(cls, entry, channel_ref: Union[firestore.DocumentReference, str]) -> "Video":
+    def from_rss_entry(cls, entry, channel_ref: "Union[firestore.DocumentReference, str]") -> "Video":
         """Create Video from RSS feed entry."""
         vid = getattr(entry, "yt_videoid", None) or entry.get("id")
         title = entry.get("title", "Untitled")
-        link = entry.get("link") or f"https://www.youtube.com/watch?v={vid}" if vid else None
-        thumbnail = entry.get("media_thumbnail", [{}])[0].get("url") or entry.get("media_content", [{}])[0].get("url")
+        link = entry.get("link") or (f"https://www.youtube.com/watch?v={vid}" if vid else None)
+
+        media_thumbnail = entry.get("media_thumbnail")
+        media_content = entry.get("media_content")
+        thumbnail = None
+        if media_thumbnail:
+            thumbnail = media_thumbnail[0].get("url")
+        if not thumbnail and media_content:
+            thumbnail = media_content[0].get("url")
 
         published = entry.get("published_parsed")
         published_at = None
         if published:
             try:
-                from datetime import timezone
-                published_at = datetime(*published[:6], tzinfo=timezone.utc).isoformat()
+                published_at = datetime(*published[:6], tzinfo=_UTC).isoformat()
             except (TypeError, ValueError):
                 pass
 
@@ -55,4 +83,36 @@ class Video:
             thumbnail=thumbnail,
             published_at=published_at,
             view_count=None  # RSS feeds don't provide view count
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def from_atom_entry(cls, entry, channel_ref: "Union[firestore.DocumentReference, str]") -> "Video":
+        """Create Video from a YouTube Atom <entry> element."""
+        vid = entry.findtext("yt:videoId", namespaces=ATOM_NS) or entry.findtext("a:id", namespaces=ATOM_NS)
+        title = entry.findtext("a:title", namespaces=ATOM_NS) or "Untitled"
+
+        link_el = entry.find("a:link[@rel='alternate']", ATOM_NS)
+        link = link_el.get("href") if link_el is not None else None
+        link = link or (f"https://www.youtube.com/watch?v={vid}" if vid else None)
+
+        thumbnail_el = entry.find("media:group/media:thumbnail", ATOM_NS)
+        thumbnail = thumbnail_el.get("url") if thumbnail_el is not None else None
+
+        published_at = None
+        published = entry.findtext("a:published", namespaces=ATOM_NS)
+        if published:
+            try:
+                parsed = datetime.fromisoformat(published.replace("Z", "+00:00"))
+                published_at = parsed.astimezone(_UTC).replace(microsecond=0).isoformat()
+            except ValueError:
+                pass
+
+        return cls(
+            video_id=vid,
+            title=title,
+            channel_ref=channel_ref,
+            link=link,
+            thumbnail=thumbnail,
+            published_at=published_at,
+            view_count=None  # RSS feeds don't provide view count
+        )
@@ -1,17 +1,51 @@
 """Main bot service orchestrator."""
 
+import logging
+import sched
+import signal
 import time
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, Optional
 from croniter import croniter
 
 from ..config.settings import BotConfig
 from ..models.channel import Channel
 from ..models.video import Video
-from ..services.firebase_service import FirebaseService, FirebaseRepository
+from ..services.firebase_service import FirebaseService, FirebaseRepository, WRITE_BATCH_SIZE
 from ..services.youtube_service import YouTubeService, RSSService
 from ..services.telegram_service import TelegramService
 from ..services.redis_service import RedisService
+from ..services.websub_server import WebSubServer, LEASE_RENEWAL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of RSS feeds fetched in parallel during a video poll
+RSS_FETCH_WORKERS = 32
+
+# Threads that run due cron jobs, so a slow job does not hold up the others
+CRON_JOB_WORKERS = 2
+
+# Adaptive polling: wait a quarter of the time since a channel's last upload
+# before polling it again, capped at one day
+POLL_BACKOFF_DIVISOR = 4
+MAX_POLL_INTERVAL_SECONDS = 24 * 3600
+
+# Full videos use the watch URL; shorts and other formats are filtered out
+_WATCH_PREFIX = "https://www.youtube.com/watch?v="
+
+
+@lru_cache(maxsize=1024)
+def _parse_rfc3339(value: str) -> datetime:
+    """Parse a feed timestamp; the same published_at is often seen by both RSS and WebSub."""
+    # Only a trailing Z needs rewriting, so avoid scanning the whole string with replace()
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
 
 
 class YouTubeBotService:
@@ -45,8 +79,8 @@ class YouTubeBotService:
             if not self._firebase_service.is_available:
                 raise ValueError("Firebase is required but not available")
         except Exception as e:
-            print(f"[bot] Firebase initialization failed: {e}")
-            print("[bot] Firebase is required for data persistence. Please check your configuration.")
+            logger.error("[bot] Firebase initialization failed: %s", e)
+            logger.error("[bot] Firebase is required for data persistence. Please check your configuration.")
             raise
 
         # Initialize Redis service
@@ -55,46 +89,84 @@ class YouTubeBotService:
             if not self._redis_service.is_available():
                 raise ValueError("Redis is required but not available")
         except Exception as e:
-            print(f"[bot] Redis initialization failed: {e}")
-            print("[bot] Redis is required for video storage. Please check your UPSTASH_REDIS_URL.")
+            logger.error("[bot] Redis initialization failed: %s", e)
+            logger.error("[bot] Redis is required for video storage. Please check your UPSTASH_REDIS_URL.")
             raise
 
+        # Long-lived pool for RSS fetches, reused across polls
+        self._rss_executor = ThreadPoolExecutor(max_workers=RSS_FETCH_WORKERS, thread_name_prefix="rss")
+        # channel_id -> epoch seconds before which the channel is not polled again
+        self._next_poll_at = {}
+
+        # Cron scheduler; waits are interruptible through the stop event
+        self._stop_event = threading.Event()
+        self._scheduler = sched.scheduler(time.monotonic, self._wait)
+        self._job_executor = ThreadPoolExecutor(max_workers=CRON_JOB_WORKERS, thread_name_prefix="cron")
+        # tag -> latest run of that job, used to skip a run while the previous one is still going
+        self._running_jobs: dict[str, Future] = {}
+
+        # Optional WebSub push notifications (RSS polling remains as fallback)
+        self._videos_lock = threading.Lock()
+        self._websub_server = None
+        if config.websub_callback_url:
+            self._websub_server = WebSubServer(
+                config.websub_callback_url,
+                config.websub_port,
+                self._on_pushed_video,
+                secret=config.websub_secret,
+                is_known_channel=self._firebase_service.channel_exists
+            )
+
     def start(self) -> None:
         """Start the bot."""
-        print("YouTube → Telegram notifier starting…")
-        print(f"INIT_MODE={self._config.init_mode}, "
-              f"VIDEO_CRON={self._config.video_cron}, "
-              f"CHANNEL_CRON={self._config.channel_cron}, "
-              f"SUMMARY_CRON={self._config.summary_cron}")
+        logger.info("YouTube → Telegram notifier starting…")
+        logger.info("INIT_MODE=%s, VIDEO_CRON=%s, CHANNEL_CRON=%s, SUMMARY_CRON=%s",
+                    self._config.init_mode, self._config.video_cron,
+                    self._config.channel_cron, self._config.summary_cron)
 
         # Send startup notification
         self._send_startup_notification()
 
-        # Start background tasks
-        channel_thread = threading.Thread(target=self._run_channel_sync, daemon=True)
-        video_thread = threading.Thread(target=self._run_video_poll, daemon=True)
-        summary_thread = threading.Thread(target=self._run_summary_sender, daemon=True)
+        if self._websub_server:
+            self._websub_server.start()
+            threading.Thread(target=self._subscribe_websub, daemon=True).start()
 
-        channel_thread.start()
-        video_thread.start()
-        summary_thread.start()
-
-        # Keep main thread alive
+        # Run all cron jobs on the main thread until stopped by a signal or stop()
+        self._install_signal_handlers()
         try:
-            while True:
-                time.sleep(3600)  # Sleep for 1 hour
+            self._run_scheduler()
         except KeyboardInterrupt:
-            print("Shutting down…")
+            self.stop()
+        self._shutdown()
+
+    def stop(self) -> None:
+        """Stop the scheduler loop; pending waits return immediately."""
+        self._stop_event.set()
+
+    def _install_signal_handlers(self) -> None:
+        """Turn SIGTERM and SIGINT into stop(), so container restarts shut down cleanly."""
+        if threading.current_thread() is not threading.main_thread():
+            # signal.signal only works on the main thread
+            return
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: self.stop())
+
+    def _shutdown(self) -> None:
+        """Let in-flight jobs finish their writes, then release the worker pools."""
+        logger.info("Shutting down…")
+        if self._websub_server:
+            self._websub_server.stop()
+        self._job_executor.shutdown(wait=True, cancel_futures=True)
+        self._rss_executor.shutdown(wait=True, cancel_futures=True)
 
     def _send_startup_notification(self) -> None:
         """Send startup notification to Telegram."""
         user_info = self._youtube_service.get_user_channel_info()
 
-        try:
-            subscriptions = self._youtube_service.fetch_all_subscriptions()
-            sub_count = len(subscriptions)
-        except Exception:
-            sub_count = "Unknown"
+        # Count stored channels rather than paging through the YouTube subscriptions API;
+        # this also warms the channel cache used by the first poll
+        channels = self._firebase_service.get_all_channels()
+        sub_count = "Unknown" if self._firebase_service.channels_load_failed else len(channels)
 
         config_info = (f"⚙️ *Bot Configuration*\n"
                       f"Video Poll Cron: `{self._config.video_cron}`\n"
@@ -105,142 +177,134 @@ class YouTubeBotService:
         user_title = user_info.title if user_info else None
         self._telegram_service.send_startup_message(user_title, sub_count, config_info)
 
-    def _run_channel_sync(self) -> None:
-        """Background task to sync channel subscriptions.
+    def _run_scheduler(self) -> None:
+        """Run all cron jobs from a single scheduler loop until stop() is called.
 
-        Uses YouTube Data API v3 - CONSUMES API QUOTA.
-        Keep frequency low to minimize costs.
+        Channel sync uses YouTube Data API v3 - CONSUMES API QUOTA, keep its
+        frequency low. Video polling uses RSS feeds - NO API QUOTA COST.
+        The summary sender sends and clears the videos stored in Redis.
         """
-        # # Initial sync on startup
-        # self._sync_subscriptions()
-
-        cron = croniter(self._config.channel_cron, datetime.now())
-
-        while True:
-            next_sync = cron.get_next(datetime)
-            print(f"[channel] Next channel sync scheduled at: {next_sync.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            # Calculate sleep time until next execution
-            sleep_seconds = (next_sync - datetime.now()).total_seconds()
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
-
-            self._sync_subscriptions()
-
-    def _run_video_poll(self) -> None:
-        """Background task to poll for new videos.
-
-        Uses RSS feeds - NO API QUOTA COST.
-        Can run frequently without cost concerns.
-        """
-        cron = croniter(self._config.video_cron, datetime.now())
-
-        while True:
-            next_poll = cron.get_next(datetime)
-            print(f"[video] Next video poll scheduled at: {next_poll.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            # Calculate sleep time until next execution
-            sleep_seconds = (next_poll - datetime.now()).total_seconds()
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
-
-            self._poll_videos_once()
-
-    def _run_summary_sender(self) -> None:
-        """Background task to send daily video summaries.
-
-        Retrieves videos from Redis and sends summary notifications.
-        Clears Redis data after successful summary send.
+        # Aware time in a named zone: the schedules' float timestamps are true epoch
+        # seconds and stay on local wall-clock time across DST changes
+        now = datetime.now(self._config.cron_tz())
+        jobs = (
+            ("channel", "channel sync", self._config.channel_cron_iter, self._config.channel_cron,
+             self._sync_subscriptions),
+            ("video", "video poll", self._config.video_cron_iter, self._config.video_cron,
+             self._poll_videos_once),
+            ("summary", "summary", self._config.summary_cron_iter, self._config.summary_cron,
+             self._send_daily_summary),
+        )
+        for tag, name, cron, expression, job in jobs:
+            cron = cron or croniter(expression)
+            # Start from now rather than from validate(), which may be well in the past
+            cron.set_current(now, force=True)
+            self._schedule_next(cron, job, tag, name)
+        if self._websub_server:
+            self._schedule_lease_renewal()
+
+        self._scheduler.run()
+
+    def _wait(self, timeout: float) -> None:
+        """Scheduler delay function: sleep until timeout or stop(), whichever comes first."""
+        if self._stop_event.wait(timeout):
+            # Empty the queue so scheduler.run() returns
+            for event in self._scheduler.queue:
+                self._scheduler.cancel(event)
+
+    def _schedule_next(self, cron: croniter, job, tag: str, name: str) -> None:
+        """Queue the next cron run of a job."""
+        if self._stop_event.is_set():
+            return
+        next_ts = cron.get_next(float)
+        logger.info("[%s] Next %s scheduled at: %s", tag, name,
+                    datetime.fromtimestamp(next_ts, self._config.cron_tz()))
+        # Cron times are wall-clock; the queue runs on the monotonic clock so clock steps can't skew waits
+        delay = max(0.0, next_ts - time.time())
+        self._scheduler.enter(delay, 0, self._run_scheduled_job, (cron, job, tag, name))
+
+    def _run_scheduled_job(self, cron: croniter, job, tag: str, name: str) -> None:
+        """Hand a due job to the job pool, then queue its next run."""
+        self._submit_job(job, tag, name)
+        self._schedule_next(cron, job, tag, name)
+
+    def _schedule_lease_renewal(self) -> None:
+        """Queue the next WebSub lease renewal.
+
+        Leases run on a fixed timer rather than CHANNEL_CRON, which may be too
+        infrequent to renew them before they lapse.
         """
-        cron = croniter(self._config.summary_cron, datetime.now())
-
-        while True:
-            next_summary = cron.get_next(datetime)
-            print(f"[summary] Next summary scheduled at: {next_summary.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            # Calculate sleep time until next execution
-            sleep_seconds = (next_summary - datetime.now()).total_seconds()
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
-
-            self._send_daily_summary()
+        if self._stop_event.is_set():
+            return
+        self._scheduler.enter(LEASE_RENEWAL_SECONDS, 0, self._run_lease_renewal)
+
+    def _run_lease_renewal(self) -> None:
+        """Hand the lease renewal to the job pool, then queue the next one."""
+        self._submit_job(self._subscribe_websub, "websub", "lease renewal")
+        self._schedule_lease_renewal()
+
+    def _submit_job(self, job, tag: str, name: str) -> None:
+        """Run a job on the job pool unless its previous run is still going."""
+        running = self._running_jobs.get(tag)
+        if running and not running.done():
+            logger.info("[%s] Previous %s still running, skipping this run", tag, name)
+        else:
+            self._running_jobs[tag] = self._job_executor.submit(self._run_job, job, tag, name)
+
+    def _run_job(self, job, tag: str, name: str) -> None:
+        """Run one cron job, logging rather than propagating its errors."""
+        try:
+            job()
+        except Exception as e:
+            logger.error("[%s] Error during %s: %s", tag, name, e)
 
     def _send_daily_summary(self) -> None:
         """Send daily summary of stored videos and clear Redis data."""
         try:
-            print("[summary] Generating daily video summary...")
+            logger.info("[summary] Generating daily video summary...")
 
-            # Get stored videos and filtered count from Redis
-            stored_videos = self._redis_service.get_stored_videos()
-            filtered_count = self._redis_service.get_filtered_count()
+            # Get stored videos and filtered count from Redis in one request
+            stored_videos, filtered_count = self._redis_service.get_summary_data()
 
             if not stored_videos and filtered_count == 0:
-                print("[summary] No videos found in Redis. No summary to send.")
+                logger.info("[summary] No videos found in Redis. No summary to send.")
                 return
 
             # Send summary notification with filtered count
             self._telegram_service.send_video_summary_notification(stored_videos, filtered_count)
 
             video_count = len(stored_videos)
-            summary_info = f"[summary] Sent daily summary with {video_count} videos"
             if filtered_count > 0:
-                summary_info += f" ({filtered_count} shorts/non-standard filtered out)"
-            print(f"{summary_info}.")
+                logger.info("[summary] Sent daily summary with %d videos (%d shorts/non-standard filtered out).",
+                            video_count, filtered_count)
+            else:
+                logger.info("[summary] Sent daily summary with %d videos.", video_count)
 
             # Clear Redis data after successful send
             cleared_count = self._redis_service.clear_stored_videos()
-            print(f"[summary] Cleared {cleared_count} videos and filtered count from Redis.")
+            logger.info("[summary] Cleared %s videos and filtered count from Redis.", cleared_count)
 
         except Exception as e:
-            print(f"[summary] Error sending daily summary: {e}")
+            logger.error("[summary] Error sending daily summary: %s", e)
 
     def _is_full_youtube_video(self, video: Video) -> bool:
         """Check if video has full YouTube watch URL format (not a short)."""
-        if not video.link:
-            return False
-
-        # Check if the URL matches the full YouTube watch format
-        return video.link.startswith("https://www.youtube.com/watch?v=")
+        return bool(video.link) and video.link.startswith(_WATCH_PREFIX)
 
     def _sync_subscriptions(self) -> None:
         """Sync YouTube subscriptions using YouTube Data API v3.
 
         WARNING: This method consumes API quota (1 unit per subscription).
         """
-        print("[subs] Syncing subscriptions… (using YouTube Data API - costs quota)")
+        logger.info("[subs] Syncing subscriptions… (using YouTube Data API - costs quota)")
 
         try:
-            subscription_tuples = self._youtube_service.fetch_all_subscriptions()
             newly_added = []
-
-            for channel_id, title, thumbnail in subscription_tuples:
-                # Check if channel already exists in Firebase
-                is_new = not self._firebase_service.channel_exists(channel_id)
-
-                if is_new:
-                    # New channel - create with default notify=True
-                    channel = Channel(
-                        channel_id=channel_id,
-                        title=title or channel_id,
-                        thumbnail=thumbnail
-                    )
-                else:
-                    # Existing channel - get current settings and preserve notify preference
-                    existing_channel = self._firebase_service.get_channel(channel_id)
-                    channel = Channel(
-                        channel_id=channel_id,
-                        title=title or channel_id,
-                        thumbnail=thumbnail,
-                        last_video_id=existing_channel.last_video_id,
-                        notify=existing_channel.notify,  # Preserve existing notify setting
-                        last_upload_at=existing_channel.last_upload_at
-                    )
-
-                # Save to Firebase (will merge if exists)
-                self._firebase_service.save_subscription(channel)
-
-                if is_new:
-                    newly_added.append(channel)
+            # Subscriptions stream page by page into the batched writer, so only
+            # one write batch of updates is alive at a time
+            self._firebase_service.update_channel_fields_bulk(
+                self._subscription_updates(self._youtube_service.fetch_all_subscriptions(), newly_added)
+            )
 
             # Update sync timestamp
             self._firebase_service.update_last_sync_time()
@@ -250,19 +314,48 @@ class YouTubeBotService:
                 f"Added {len(newly_added)} new channels."
             )
 
-            print(f"[subs] Subscription sync completed. Added {len(newly_added)} new channels.")
+            logger.info("[subs] Subscription sync completed. Added %s new channels.", len(newly_added))
+
+            # Cover newly added channels (and renew the others' leases early)
+            self._subscribe_websub()
 
         except Exception as e:
-            print(f"[subs] Error during sync: {e}")
+            logger.error("[subs] Error during sync: %s", e)
+
+    def _subscription_updates(self, subscriptions: Iterable[tuple[str, str, Optional[str]]],
+                              newly_added: list[Channel]) -> Iterator[tuple[str, dict]]:
+        """Turn subscription tuples into (channel_id, fields) Firestore updates.
+
+        New channels are written in full and appended to newly_added. Existing ones
+        (found with one existence check per write batch) only get their title and
+        thumbnail refreshed, leaving notify and poll progress untouched.
+        """
+        subscriptions = iter(subscriptions)
+        while chunk := list(islice(subscriptions, WRITE_BATCH_SIZE)):
+            existing = self._firebase_service.channels_exist_batch(
+                [channel_id for channel_id, _, _ in chunk]
+            )
+
+            for channel_id, title, thumbnail in chunk:
+                if existing[channel_id]:
+                    yield channel_id, {'title': title or channel_id, 'thumbnail': thumbnail}
+                    continue
+
+                # New channel - create with default notify=True
+                channel = Channel(
+                    channel_id=channel_id,
+                    title=title or channel_id,
+                    thumbnail=thumbnail
+                )
+                newly_added.append(channel)
+                yield channel_id, channel.to_dict()
 
     def _poll_videos_once(self) -> None:
         """Poll for new videos from all subscribed channels using RSS feeds.
 
         Uses RSS feeds - NO API quota cost.
         """
-        print("[rss] polling new videos (using RSS - free)")
-        new_videos = []
-        firestore_filtered_count = 0
+        logger.info("[rss] polling new videos (using RSS - free)")
         channels = self._firebase_service.get_all_channels()
 
         # Filter channels to only poll those with notifications enabled
@@ -270,120 +363,202 @@ class YouTubeBotService:
         channels_skipped = len(channels) - len(channels_to_poll)
 
         if channels_skipped > 0:
-            print(f"[rss] Skipping {channels_skipped} channels with notifications disabled")
+            logger.info("[rss] Skipping %s channels with notifications disabled", channels_skipped)
 
-        for channel in channels_to_poll:
-            latest_video = self._rss_service.get_latest_video(channel)
+        # Dormant channels are polled less often than active ones
+        now = time.time()
+        due_channels = self._due_channels(channels_to_poll, now)
+        if len(due_channels) < len(channels_to_poll):
+            logger.info("[rss] Backing off %s low-activity channels", len(channels_to_poll) - len(due_channels))
 
-            if not latest_video or not latest_video.video_id:
+        # Fetch feeds concurrently (network-bound); Firebase/Redis updates stay on this thread
+        fetches = list(self._rss_executor.map(self._fetch_latest_video, due_channels))
+
+        unsaved = self._handle_latest_videos(
+            ((channel, video) for channel, (_, video) in zip(due_channels, fetches)), "rss"
+        )
+
+        for channel, (fetched, video) in zip(due_channels, fetches):
+            if not fetched or channel.channel_id in unsaved:
+                # Keep failed channels due, so they are retried on the next tick
+                self._next_poll_at.pop(channel.channel_id, None)
                 continue
+            self._next_poll_at[channel.channel_id] = now + self._poll_delay(
+                self._latest_upload_at(channel, video), now
+            )
 
-            # Check if this is a new video
-            if not channel.last_video_id:
-                # First-time bootstrap - save video but only notify if INIT_MODE=false
-                video_saved = self._process_new_video(channel, latest_video)
-                if video_saved and not self._config.init_mode:
-                    new_videos.append(latest_video)
-                elif not video_saved:
-                    firestore_filtered_count += 1
-            elif latest_video.video_id != channel.last_video_id:
-                # New video detected - always include in notifications
-                video_saved = self._process_new_video(channel, latest_video)
-                if video_saved:
-                    new_videos.append(latest_video)
+    def _due_channels(self, channels: Iterable[Channel], now: float) -> list[Channel]:
+        """The channels whose backoff has run out (channels never polled are always due)."""
+        return [channel for channel in channels if self._next_poll_at.get(channel.channel_id, 0) <= now]
+
+    def _fetch_latest_video(self, channel: Channel) -> tuple[bool, Optional[Video]]:
+        """Fetch a channel's latest video; the flag is False when the fetch failed."""
+        try:
+            return True, self._rss_service.get_latest_video(channel)
+        except Exception as e:
+            logger.error("[rss] Error parsing %s: %s", channel.rss_url, e)
+            return False, None
+
+    @staticmethod
+    def _latest_upload_at(channel: Channel, video: Optional[Video]) -> Optional[datetime]:
+        """The newest known upload time: the stored one or the fetched feed's, whichever is later."""
+        last_upload_at = channel.last_upload_at
+        if video and video.published_at:
+            try:
+                published = _parse_rfc3339(video.published_at)
+            except (ValueError, TypeError):
+                return last_upload_at
+            if not last_upload_at or published > last_upload_at:
+                return published
+        return last_upload_at
+
+    @staticmethod
+    def _poll_delay(last_upload_at: Optional[datetime], now: float) -> float:
+        """Seconds to wait before polling a channel again, based on its upload cadence.
+
+        A quarter of the time since the last upload, between 0 (an upload in the
+        future, e.g. clock skew) and MAX_POLL_INTERVAL_SECONDS. Channels with no
+        known upload are polled on every tick.
+        """
+        if not last_upload_at:
+            return 0
+        gap = max(0.0, now - last_upload_at.timestamp())
+        return min(gap / POLL_BACKOFF_DIVISOR, MAX_POLL_INTERVAL_SECONDS)
+
+    def _handle_latest_videos(self, results, tag: str) -> set[str]:
+        """Save, store and report the latest video seen for each channel.
+
+        Shared by RSS polling and WebSub pushes; serialized so both paths never
+        process the same channel at once. Returns the IDs of the channels whose
+        new video could not be saved.
+        """
+        with self._videos_lock:
+            # (updated channel, video) pairs to persist
+            updates = []
+            # Channels whose new video goes into the summary
+            notify_ids = set()
+            firestore_filtered_count = 0
+
+            init_mode = self._config.init_mode
+            for channel, latest_video in results:
+                if not latest_video or not latest_video.video_id:
+                    continue
+                if latest_video.video_id == channel.last_video_id:
+                    continue
+
+                # A channel without a last video is being bootstrapped: save its
+                # video, but only notify if INIT_MODE=false. New videos always notify.
+                notify = bool(channel.last_video_id) or not init_mode
+                updated_channel = self._process_new_video(channel, latest_video)
+                if updated_channel:
+                    updates.append((updated_channel, latest_video))
+                    if notify:
+                        notify_ids.add(channel.channel_id)
                 else:
                     firestore_filtered_count += 1
 
-        # Store new videos in Redis (all videos here are already full YouTube videos)
-        if new_videos:
-            stored_count = 0
-            for video in new_videos:
-                self._redis_service.store_video(video)
-                stored_count += 1
+            # Persist new videos and channel progress in batched Firestore writes
+            committed = self._firebase_service.save_new_videos(updates) if updates else set()
+            failed = {channel.channel_id for channel, _ in updates if channel.channel_id not in committed}
+            if failed:
+                # The feeds' validators already moved past these videos; drop them
+                # so the next poll reads the feeds again and retries the save
+                for channel_id in failed:
+                    self._rss_service.forget(channel_id)
+                logger.warning("[%s] %s new videos were not saved to Firestore; retrying on the next poll", tag, len(failed))
 
-            print(f"[rss] Stored {stored_count} new videos in Redis for later summary.")
+            # Only videos that reached Firestore are reported
+            new_videos = [video for channel, video in updates
+                          if channel.channel_id in committed and channel.channel_id in notify_ids]
 
-        # Report filtering statistics
-        if firestore_filtered_count > 0:
-            print(f"[rss] Filtered out {firestore_filtered_count} shorts/non-standard videos (not saved to Firestore).")
-            # Store filtered count in Redis for summary reporting
-            self._redis_service.increment_filtered_count(firestore_filtered_count)
+            # Store new videos and the filtered count in Redis in one request
+            # (all videos here are already full YouTube videos)
+            if new_videos or firestore_filtered_count > 0:
+                self._redis_service.store_videos(new_videos, firestore_filtered_count)
 
-        if not new_videos and firestore_filtered_count == 0:
-            print("[rss] Video polling completed. No new videos found.")
+            if new_videos:
+                logger.info("[%s] Stored %s new videos in Redis for later summary.", tag, len(new_videos))
 
-    def _process_new_video(self, channel: Channel, video: Video) -> bool:
-        """Process a new video discovery. Returns True if video was saved, False if filtered out."""
-        from datetime import datetime
+            # Report filtering statistics
+            if firestore_filtered_count > 0:
+                logger.info("[%s] Filtered out %s shorts/non-standard videos (not saved to Firestore).", tag, firestore_filtered_count)
 
-        # Filter out shorts before saving to Firestore
-        if not self._is_full_youtube_video(video):
-            return False
+            if not new_videos and firestore_filtered_count == 0:
+                logger.info("[%s] Video polling completed. No new videos found.", tag)
 
-        # Save to Firebase (only full videos, not shorts)
-        self._firebase_service.save_video(video)
-        self._firebase_service.update_channel_last_video(channel.channel_id, video.video_id)
+            return failed
 
-        # Update the channel's last upload time based on video's published_at
-        if video.published_at:
+    def _on_pushed_video(self, channel_id: str, video: Video) -> None:
+        """Handle a video announced by the WebSub hub."""
+        try:
+            channel = self._firebase_service.get_channel(channel_id)
+        except Exception:
+            logger.info("[websub] Ignoring push for unknown channel %s", channel_id)
+            return
+
+        if not channel.notify:
+            return
+
+        # The hub also pushes title/description edits of older uploads
+        if channel.last_upload_at and video.published_at:
             try:
-                upload_time = datetime.fromisoformat(video.published_at.replace('Z', '+00:00'))
-                # Update channel with new last_upload_at
-                updated_channel = Channel(
-                    channel_id=channel.channel_id,
-                    title=channel.title,
-                    thumbnail=channel.thumbnail,
-                    last_video_id=video.video_id,
-                    notify=channel.notify,
-                    last_upload_at=upload_time
-                )
-                self._firebase_service.save_subscription(updated_channel)
+                published = _parse_rfc3339(video.published_at)
+                if published <= channel.last_upload_at:
+                    return
             except (ValueError, TypeError):
-                # If we can't parse the date, just update without last_upload_at
                 pass
 
-        return True
+        logger.info("[websub] Push received for %s: %s", channel.title, video.title)
+        self._handle_latest_videos([(channel, video)], "websub")
 
-    def toggle_channel_notifications(self, channel_id: str) -> bool:
-        """Toggle notification preference for a channel."""
-        try:
-            # Get current channel state
-            channel = self._firebase_service.get_channel(channel_id)
+    def _subscribe_websub(self) -> None:
+        """Subscribe (or renew leases for) all notifying channels at the WebSub hub."""
+        if not self._websub_server:
+            return
+        channels = self._firebase_service.get_all_channels()
+        self._websub_server.subscribe_all(channel.channel_id for channel in channels if channel.notify)
 
-            # Toggle the notification preference
-            new_notify_state = not channel.notify
+    def _process_new_video(self, channel: Channel, video: Video) -> Optional[Channel]:
+        """Process a new video discovery.
 
-            # Update in Firebase
-            success = self._firebase_service.update_channel_notify_preference(channel_id, new_notify_state)
+        Returns a copy of the channel with its progress moved to the video, or
+        None if the video is filtered out. The channel itself (usually a cached
+        instance) is left alone: the Firebase service applies the progress to the
+        cache only once _handle_latest_videos has committed it.
+        """
+        # Filter out shorts before saving to Firestore (inlined _is_full_youtube_video)
+        link = video.link
+        if not link or not link.startswith(_WATCH_PREFIX):
+            return None
 
-            if success:
-                state_text = "enabled" if new_notify_state else "disabled"
-                print(f"[bot] Notifications {state_text} for channel: {channel.title}")
-                return True
-            else:
-                print(f"[bot] Failed to update notification preference for channel: {channel.title}")
-                return False
+        last_upload_at = channel.last_upload_at
+        # Update the channel's last upload time based on video's published_at
+        if video.published_at:
+            try:
+                last_upload_at = _parse_rfc3339(video.published_at)
+            except (ValueError, TypeError):
+                # If we can't parse the date, keep the previous last_upload_at
+                pass
 
-        except Exception as e:
-            print(f"[bot] Error toggling notifications for channel {channel_id}: {e}")
-            return False
+        return replace(channel, last_video_id=video.video_id, last_upload_at=last_upload_at)
+
+    def toggle_channel_notifications(self, channel_id: str) -> bool:
+        """Toggle notification preference for a channel."""
+        return self._update_channel_notifications(channel_id, None)
 
     def set_channel_notifications(self, channel_id: str, notify: bool) -> bool:
         """Set notification preference for a channel."""
-        try:
-            success = self._firebase_service.update_channel_notify_preference(channel_id, notify)
-
-            if success:
-                channel = self._firebase_service.get_channel(channel_id)
-                state_text = "enabled" if notify else "disabled"
-                print(f"[bot] Notifications {state_text} for channel: {channel.title}")
-                return True
-            else:
-                print(f"[bot] Failed to update notification preference for channel {channel_id}")
-                return False
+        return self._update_channel_notifications(channel_id, notify)
 
+    def _update_channel_notifications(self, channel_id: str, notify: Optional[bool]) -> bool:
+        """Set or toggle (notify=None) a channel's preference with a single Firestore transaction."""
+        try:
+            channel = self._firebase_service.update_and_return_channel(channel_id, notify)
+            state_text = "enabled" if channel.notify else "disabled"
+            logger.info("[bot] Notifications %s for channel: %s", state_text, channel.title)
+            return True
         except Exception as e:
-            print(f"[bot] Error setting notifications for channel {channel_id}: {e}")
+            logger.error("[bot] Error updating notifications for channel %s: %s", channel_id, e)
             return False
 
     def _should_notify_for_channel(self, channel_id: str) -> bool:
@@ -1,19 +1,63 @@
 """Firebase service for data persistence."""
 
+import logging
 import os
-from typing import Optional, Protocol
+import threading
+import time
+from typing import Iterable, Optional, Protocol
 from datetime import datetime
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.api_core import retry
+from google.api_core.exceptions import Aborted, DeadlineExceeded, ServiceUnavailable
 import pytz
 
 from ..models.video import Video
 from ..models.channel import Channel
 
+logger = logging.getLogger(__name__)
+
+# Firestore allows at most 500 writes per batch
+WRITE_BATCH_SIZE = 500
+# Documents requested per get_all() call when bulk-reading channels
+READ_BATCH_SIZE = 300
+# Attempts per document before a bulk subscription write is given up on
+MAX_WRITE_ATTEMPTS = 5
+
+
+def _log_write_retry(error: Exception) -> None:
+    logger.debug("[firebase] Retrying write after transient error: %s", error)
+
+
+# Backoff for single-document writes and batch commits on transient errors; all
+# of them are merges or field updates, so replaying one is safe
+WRITE_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(Aborted, DeadlineExceeded, ServiceUnavailable),
+    initial=0.5, maximum=8.0, multiplier=2.0, timeout=60.0, on_error=_log_write_retry
+)
+
+# Stored subscription fields that Channel.from_state_dict actually reads
+CHANNEL_FIELDS = ('title', 'thumbnail', 'last_video_id', 'notify', 'last_upload_at')
+
+# Daily counters roll over at midnight UTC+8
+UTC8_OFFSET_SECONDS = 8 * 3600
+# Operations between two daily stats log lines
+STATS_LOG_INTERVAL = 100
+
 
 class FirebaseRepository(Protocol):
     """Protocol for Firebase repository operations."""
 
+    @property
+    def is_available(self) -> bool:
+        """Check if Firebase is available."""
+        ...
+
+    @property
+    def channels_load_failed(self) -> bool:
+        """Check if the last read of all channels from Firebase failed."""
+        ...
+
     def save_video(self, video: Video) -> bool:
         """Save video to Firebase."""
         ...
@@ -22,12 +66,25 @@ class FirebaseRepository(Protocol):
         """Save subscription to Firebase."""
         ...
 
-    def update_channel_last_video(self, channel_id: str, video_id: str) -> bool:
-        """Update last processed video for a channel."""
+    def save_subscriptions_bulk(self, channels: Iterable[Channel]) -> int:
+        """Save many subscriptions to Firebase in batched writes."""
+        ...
+
+    def update_channel_fields_bulk(self, updates: Iterable[tuple[str, dict]]) -> int:
+        """Merge (channel_id, fields) updates into subscriptions with a bulk writer."""
         ...
 
-    def get_all_channels(self) -> list[Channel]:
-        """Get all subscribed channels from Firebase."""
+    def update_channel_last_video(self, channel_id: str, video_id: str,
+                                  last_upload_at: Optional[datetime] = None) -> bool:
+        """Update last processed video (and optionally last upload time) for a channel."""
+        ...
+
+    def save_new_videos(self, updates: list[tuple[Channel, Video]]) -> set[str]:
+        """Save (channel, video) progress in batched writes; returns the committed channel IDs."""
+        ...
+
+    def get_all_channels(self) -> tuple[Channel, ...]:
+        """Get all subscribed channels from Firebase. The channels are shared and read-only."""
         ...
 
     def get_channel(self, channel_id: str) -> Channel:
@@ -50,6 +107,10 @@ class FirebaseRepository(Protocol):
         """Update notification preference for a channel."""
         ...
 
+    def update_and_return_channel(self, channel_id: str, notify: Optional[bool] = None) -> Channel:
+        """Set (or toggle, when notify is None) a channel's notify flag and return the updated channel."""
+        ...
+
     def get_daily_stats(self) -> dict[str, int]:
         """Get current daily Firestore operation stats."""
         ...
@@ -61,14 +122,32 @@ class FirebaseService:
     def __init__(self, credentials_file: str):
         self._credentials_file = credentials_file
         self._db: Optional[firestore.Client] = None
-        self._channels_cache: Optional[list[Channel]] = None
+        self._channels_cache: Optional[tuple[Channel, ...]] = None
         self._cache_timestamp: Optional[datetime] = None
         self._cache_ttl_minutes = 1380  # Cache for 23 hours
+        # Past the TTL but within this age, get_all_channels serves the stale cache
+        # while a background thread refreshes it
+        self._cache_stale_ttl_minutes = 1440
+        self._cache_refreshing = False
+        self._channels_load_failed = False
+        # IDs known to be stored. Subscriptions are never deleted, so this stays
+        # valid across cache expiry and answers "exists" without a read.
+        self._known_channel_ids: frozenset[str] = frozenset()
+        # Cache writes made while a reload streams the subscriptions; the reload may
+        # have read those channels before the writes, so it re-applies them
+        self._reloads_in_flight = 0
+        self._writes_during_reload: list[tuple[str, dict]] = []
+        # Guards the cache and counters, which are shared by the poll, sync and WebSub threads
+        self._lock = threading.RLock()
         
         # Firestore operation counters
         self._read_count = 0
         self._write_count = 0
         self._last_reset_date: Optional[str] = None
+        # Day number (UTC+8) of the last reset, so the per-operation check is an int compare
+        self._last_reset_day: Optional[int] = None
+        # reads + writes when the stats were last logged
+        self._last_logged_ops = 0
         self._utc8_tz = pytz.timezone('Asia/Shanghai')  # UTC+8
         
         self._initialize()
@@ -81,14 +160,14 @@ class FirebaseService:
                 if os.path.exists(self._credentials_file):
                     cred = credentials.Certificate(self._credentials_file)
                     firebase_admin.initialize_app(cred)
-                    print("[firebase] Initialized with service account")
+                    logger.info("[firebase] Initialized with service account")
                 else:
                     firebase_admin.initialize_app()
-                    print("[firebase] Initialized with default credentials")
+                    logger.info("[firebase] Initialized with default credentials")
 
             self._db = firestore.client()
         except Exception as e:
-            print(f"[firebase] Error initializing Firebase: {e}")
+            logger.error("[firebase] Error initializing Firebase: %s", e)
             self._db = None
 
     @property
@@ -96,6 +175,15 @@ class FirebaseService:
         """Check if Firebase is available."""
         return self._db is not None
 
+    @property
+    def channels_load_failed(self) -> bool:
+        """Check if the last read of all channels from Firebase failed.
+
+        get_all_channels returns an empty tuple on failure; this tells it apart
+        from having no subscriptions.
+        """
+        return self._db is None or self._channels_load_failed
+
     def _get_current_utc8_date(self) -> str:
         """Get current date in UTC+8 timezone as YYYY-MM-DD string."""
         utc8_now = datetime.now(self._utc8_tz)
@@ -103,40 +191,55 @@ class FirebaseService:
 
     def _check_and_reset_counters(self) -> None:
         """Check if counters need to be reset for a new day (UTC+8)."""
-        current_date = self._get_current_utc8_date()
-        
-        if self._last_reset_date != current_date:
+        current_day = int(time.time() + UTC8_OFFSET_SECONDS) // 86400
+
+        with self._lock:
+            if self._last_reset_day == current_day:
+                return
             if self._last_reset_date is not None:
-                print(f"[firebase] Daily reset - Previous day stats: {self._read_count} reads, {self._write_count} writes")
-            
+                logger.info("[firebase] Daily reset - Previous day stats: %s reads, %s writes", self._read_count, self._write_count)
+
+            current_date = self._get_current_utc8_date()
             self._read_count = 0
             self._write_count = 0
+            self._last_logged_ops = 0
+            self._last_reset_day = current_day
             self._last_reset_date = current_date
-            print(f"[firebase] Counters reset for {current_date} (UTC+8)")
+            logger.info("[firebase] Counters reset for %s (UTC+8)", current_date)
 
     def _increment_read_counter(self, count: int = 1) -> None:
         """Increment the read counter and check for daily reset."""
-        self._check_and_reset_counters()
-        self._read_count += count
+        with self._lock:
+            self._check_and_reset_counters()
+            self._read_count += count
 
     def _increment_write_counter(self, count: int = 1) -> None:
         """Increment the write counter and check for daily reset."""
-        self._check_and_reset_counters()
-        self._write_count += count
+        with self._lock:
+            self._check_and_reset_counters()
+            self._write_count += count
 
     def get_daily_stats(self) -> dict[str, int]:
         """Get current daily Firestore operation stats."""
-        self._check_and_reset_counters()
-        return {
-            'reads': self._read_count,
-            'writes': self._write_count,
-            'date': self._last_reset_date
-        }
+        with self._lock:
+            self._check_and_reset_counters()
+            return {
+                'reads': self._read_count,
+                'writes': self._write_count,
+                'date': self._last_reset_date
+            }
 
     def _log_current_stats(self) -> None:
-        """Log current Firestore operation stats."""
-        stats = self.get_daily_stats()
-        print(f"[firebase] Daily stats ({stats['date']}): {stats['reads']} reads, {stats['writes']} writes")
+        """Log current Firestore operation stats, once every STATS_LOG_INTERVAL operations."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        with self._lock:
+            stats = self.get_daily_stats()
+            total_ops = stats['reads'] + stats['writes']
+            if total_ops - self._last_logged_ops < STATS_LOG_INTERVAL:
+                return
+            self._last_logged_ops = total_ops
+        logger.info("[firebase] Daily stats (%s): %s reads, %s writes", stats['date'], stats['reads'], stats['writes'])
 
     def save_video(self, video: Video) -> bool:
         """Save video to Firebase."""
@@ -152,14 +255,14 @@ class FirebaseService:
                 video_data['channel_ref'] = self._db.collection('subscriptions').document(video.channel_ref)
 
             self._db.collection('videos').document(video.video_id).set(
-                video_data, merge=True
+                video_data, merge=True, retry=WRITE_RETRY
             )
             self._increment_write_counter()
             self._log_current_stats()
-            # print(f"[firebase] Saved video: {video.title}")
+            # logger.debug("[firebase] Saved video: %s", video.title)
             return True
         except Exception as e:
-            print(f"[firebase] Error saving video: {e}")
+            logger.error("[firebase] Error saving video: %s", e)
             return False
 
     def save_subscription(self, channel: Channel) -> bool:
@@ -172,35 +275,159 @@ class FirebaseService:
             channel_data['subscribed_at'] = firestore.SERVER_TIMESTAMP
 
             self._db.collection('subscriptions').document(channel.channel_id).set(
-                channel_data, merge=True
+                channel_data, merge=True, retry=WRITE_RETRY
             )
             self._increment_write_counter()
             self._log_current_stats()
-            # Invalidate cache since channels list changed
-            self._invalidate_cache()
-            # print(f"[firebase] Saved subscription: {channel.title}")
+            # Patch the cached copy rather than forcing a reload of every channel
+            self._merge_cached_channels([(channel.channel_id, channel_data)])
+            # logger.debug("[firebase] Saved subscription: %s", channel.title)
             return True
         except Exception as e:
-            print(f"[firebase] Error saving subscription: {e}")
+            logger.error("[firebase] Error saving subscription: %s", e)
             return False
 
-    def update_channel_last_video(self, channel_id: str, video_id: str) -> bool:
-        """Update last processed video for a channel."""
+    def save_subscriptions_bulk(self, channels: Iterable[Channel]) -> int:
+        """Save many subscriptions to Firebase in batched writes. Returns the number saved."""
+        return self.update_channel_fields_bulk((channel.channel_id, channel.to_dict()) for channel in channels)
+
+    def update_channel_fields_bulk(self, updates: Iterable[tuple[str, dict]]) -> int:
+        """Merge (channel_id, fields) updates into subscriptions with a bulk writer.
+
+        Only the given fields are written, so existing channels can be refreshed
+        without rewriting progress fields that a concurrent poll may be updating.
+        Writes go through a BulkWriter, which commits in parallel and retries
+        failed documents with backoff. Returns the number of channels written.
+        """
         if not self._db:
+            return 0
+
+        subscriptions_ref = self._db.collection('subscriptions')
+        counts_lock = threading.Lock()
+        counts = {'written': 0, 'failed': 0}
+        # channel_id -> fields sent but not yet confirmed by the writer
+        pending = {}
+        # Confirmed updates not yet merged into the cache, merged a write batch at a time
+        confirmed = []
+
+        def on_result(reference, result, bulk_writer) -> None:
+            ready = None
+            with counts_lock:
+                counts['written'] += 1
+                confirmed.append((reference.id, pending.pop(reference.id)))
+                if len(confirmed) >= WRITE_BATCH_SIZE:
+                    ready = confirmed[:]
+                    confirmed.clear()
+            self._increment_write_counter()
+            if ready:
+                self._merge_cached_channels(ready)
+
+        def on_error(failure, bulk_writer) -> bool:
+            if failure.attempts < MAX_WRITE_ATTEMPTS:
+                return True
+            with counts_lock:
+                counts['failed'] += 1
+                pending.pop(failure.operation.reference.id, None)
+            logger.error("[firebase] Giving up saving subscription after %s attempts: %s", failure.attempts, failure.message)
             return False
 
+        writer = self._db.bulk_writer()
+        writer.on_write_result(on_result)
+        writer.on_write_error(on_error)
         try:
-            self._db.collection('subscriptions').document(channel_id).update({
+            # Consumed lazily, so a streamed subscription list is never held in full
+            for channel_id, fields in updates:
+                with counts_lock:
+                    pending[channel_id] = fields
+                writer.set(subscriptions_ref.document(channel_id),
+                           {**fields, 'subscribed_at': firestore.SERVER_TIMESTAMP}, merge=True)
+        finally:
+            writer.close()
+            # The cache only ever sees fields that reached Firestore
+            self._merge_cached_channels(confirmed)
+
+        if counts['failed']:
+            logger.error("[firebase] %s subscription writes failed", counts['failed'])
+        self._log_current_stats()
+        return counts['written']
+
+    def update_channel_last_video(self, channel_id: str, video_id: str,
+                                  last_upload_at: Optional[datetime] = None) -> bool:
+        """Update last processed video (and optionally last upload time) for a channel."""
+        if not self._db:
+            return False
+
+        try:
+            update_data = {
                 'last_video_id': video_id,
                 'last_updated': firestore.SERVER_TIMESTAMP
-            })
+            }
+            if last_upload_at:
+                update_data['last_upload_at'] = last_upload_at.isoformat()
+
+            self._db.collection('subscriptions').document(channel_id).update(update_data, retry=WRITE_RETRY)
             self._increment_write_counter()
             self._log_current_stats()
+            changes = {'last_video_id': video_id}
+            if last_upload_at:
+                changes['last_upload_at'] = last_upload_at
+            self._update_cached_channel(channel_id, **changes)
             return True
         except Exception as e:
-            print(f"[firebase] Error updating channel last video: {e}")
+            logger.error("[firebase] Error updating channel last video: %s", e)
             return False
 
+    def save_new_videos(self, updates: list[tuple[Channel, Video]]) -> set[str]:
+        """Save new videos with their channels' last video progress in batched writes.
+
+        Each (channel, video) pair goes into the same batch, so a channel's progress
+        never commits without its video. Batches commit independently: the IDs of the
+        channels whose batch committed are returned, and only those are patched into
+        the cache. Progress is written with update(), so an unknown channel fails its
+        batch rather than creating a stub subscription.
+        """
+        if not self._db:
+            return set()
+
+        videos_ref = self._db.collection('videos')
+        subscriptions_ref = self._db.collection('subscriptions')
+        committed = set()
+        # Two writes per pair
+        pairs_per_batch = WRITE_BATCH_SIZE // 2
+        for start in range(0, len(updates), pairs_per_batch):
+            chunk = updates[start:start + pairs_per_batch]
+            batch = self._db.batch()
+            for channel, video in chunk:
+                channel_ref = subscriptions_ref.document(channel.channel_id)
+                video_ref = video.channel_ref
+                if isinstance(video_ref, str):
+                    video_ref = subscriptions_ref.document(video_ref)
+                video_data = {**video.to_dict(), 'discovered_at': firestore.SERVER_TIMESTAMP, 'channel_ref': video_ref}
+                batch.set(videos_ref.document(video.video_id), video_data, merge=True)
+
+                channel_data = {
+                    'last_video_id': channel.last_video_id,
+                    'last_updated': firestore.SERVER_TIMESTAMP
+                }
+                if channel.last_upload_at:
+                    channel_data['last_upload_at'] = channel.last_upload_at.isoformat()
+                batch.update(channel_ref, channel_data)
+
+            try:
+                batch.commit(retry=WRITE_RETRY)
+            except Exception as e:
+                logger.error("[firebase] Error saving new videos for %s channels: %s", len(chunk), e)
+                continue
+
+            self._increment_write_counter(2 * len(chunk))
+            for channel, _ in chunk:
+                self._update_cached_channel(channel.channel_id, last_video_id=channel.last_video_id,
+                                            last_upload_at=channel.last_upload_at)
+                committed.add(channel.channel_id)
+
+        self._log_current_stats()
+        return committed
+
     def _is_cache_valid(self) -> bool:
         """Check if the channels cache is still valid."""
         if not self._cache_timestamp or not self._channels_cache:
@@ -209,57 +436,157 @@ class FirebaseService:
         cache_age = datetime.now() - self._cache_timestamp
         return cache_age.total_seconds() < (self._cache_ttl_minutes * 60)
 
+    def _is_cache_servable_stale(self) -> bool:
+        """Check if an expired cache is still young enough to serve while refreshing."""
+        if not self._cache_timestamp or not self._channels_cache:
+            return False
+
+        cache_age = datetime.now() - self._cache_timestamp
+        return cache_age.total_seconds() < (self._cache_stale_ttl_minutes * 60)
+
     def _invalidate_cache(self) -> None:
         """Invalidate the channels cache."""
-        self._channels_cache = None
-        self._cache_timestamp = None
-
-    def get_all_channels(self) -> list[Channel]:
-        """Get all subscribed channels from Firebase with caching."""
+        with self._lock:
+            self._channels_cache = None
+            self._cache_timestamp = None
+
+    def _update_cached_channel(self, channel_id: str, **changes) -> None:
+        """Apply a persisted field update to the cached copy of a channel, if it is cached."""
+        with self._lock:
+            self._record_cache_write(channel_id, changes)
+            for channel in self._channels_cache or ():
+                if channel.channel_id == channel_id:
+                    for name, value in changes.items():
+                        setattr(channel, name, value)
+                    return
+
+    def _merge_cached_channels(self, updates: list[tuple[str, dict]]) -> None:
+        """Merge written subscription fields into the cache, adding channels it lacks."""
+        if not updates:
+            return
+        # Only the written keys: the others (e.g. poll progress) may have moved on
+        writes = [(channel_id, self._channel_changes(channel_id, fields)) for channel_id, fields in updates]
+        with self._lock:
+            self._known_channel_ids |= {channel_id for channel_id, _ in updates}
+            for channel_id, changes in writes:
+                self._record_cache_write(channel_id, changes)
+            if self._channels_cache is not None:
+                self._channels_cache = self._apply_cache_writes(self._channels_cache, writes)
+
+    def _record_cache_write(self, channel_id: str, changes: dict) -> None:
+        """Remember a cache write for the reloads in flight. Caller holds _lock."""
+        if self._reloads_in_flight:
+            self._writes_during_reload.append((channel_id, changes))
+
+    @staticmethod
+    def _channel_changes(channel_id: str, fields: dict) -> dict:
+        """Channel attribute values for the CHANNEL_FIELDS present in written fields."""
+        parsed = Channel.from_state_dict(channel_id, fields)
+        return {name: getattr(parsed, name) for name in CHANNEL_FIELDS if name in fields}
+
+    @staticmethod
+    def _apply_cache_writes(channels: tuple[Channel, ...],
+                            writes: list[tuple[str, dict]]) -> tuple[Channel, ...]:
+        """Apply (channel_id, changes) writes to channels and return the resulting tuple.
+
+        Channels are updated in place, as pollers may hold references to the cached
+        objects. Written channels that are missing are appended when the write
+        carries a title, i.e. the whole subscription was written.
+        """
+        by_id = {channel.channel_id: channel for channel in channels}
+        added = []
+        for channel_id, changes in writes:
+            channel = by_id.get(channel_id)
+            if channel is None:
+                if 'title' in changes:
+                    channel = by_id[channel_id] = Channel(channel_id, **changes)
+                    added.append(channel)
+                continue
+            for name, value in changes.items():
+                setattr(channel, name, value)
+        return channels + tuple(added) if added else channels
+
+    def _get_cached_channels(self) -> Optional[tuple[Channel, ...]]:
+        """Get the cached channel list if it is still valid, else None."""
+        with self._lock:
+            return self._channels_cache if self._is_cache_valid() else None
+
+    def get_all_channels(self) -> tuple[Channel, ...]:
+        """Get all subscribed channels from Firebase with caching.
+
+        A recently expired cache is returned as-is while it is reloaded in the
+        background, so callers only wait on Firestore when there is no usable copy.
+
+        The returned tuple and its Channel objects are the cache itself, not copies.
+        Callers must treat them as read-only: the service updates the channels in
+        place once writes to them are persisted, and callers see those updates.
+        To change a channel, work on a copy (dataclasses.replace) and save it.
+        """
         if not self._db:
-            return []
+            return ()
+
+        with self._lock:
+            # Return cached data if valid; shared, not copied (see the docstring)
+            if self._is_cache_valid():
+                return self._channels_cache
+            if self._is_cache_servable_stale():
+                if not self._cache_refreshing:
+                    self._cache_refreshing = True
+                    threading.Thread(target=self._refresh_channels_cache, daemon=True).start()
+                return self._channels_cache
 
-        # Return cached data if valid
-        if self._is_cache_valid():
-            return self._channels_cache.copy()
+        try:
+            return self._load_channels()
+        except Exception as e:
+            logger.error("[firebase] Error getting channels: %s", e)
+            return ()
 
+    def _refresh_channels_cache(self) -> None:
+        """Reload the channels cache in the background, keeping the stale copy on failure."""
         try:
-            docs = self._db.collection('subscriptions').get()
-            self._increment_read_counter(len(docs))
-            self._log_current_stats()
-            channels = []
-
-            for doc in docs:
-                data = doc.to_dict()
-
-                # Parse last_upload_at if it exists
-                last_upload_at = None
-                last_upload_str = data.get('last_upload_at')
-                if last_upload_str:
-                    try:
-                        last_upload_at = datetime.fromisoformat(last_upload_str)
-                    except (ValueError, TypeError):
-                        last_upload_at = None
-
-                channel = Channel(
-                    channel_id=doc.id,
-                    title=data.get('title', doc.id),
-                    thumbnail=data.get('thumbnail'),
-                    last_video_id=data.get('last_video_id', ''),
-                    notify=data.get('notify', True),  # Default to True for backward compatibility
-                    last_upload_at=last_upload_at
-                )
-                channels.append(channel)
+            self._load_channels()
+        except Exception as e:
+            logger.error("[firebase] Error refreshing channels cache: %s", e)
+        finally:
+            with self._lock:
+                self._cache_refreshing = False
+
+    def _load_channels(self) -> tuple[Channel, ...]:
+        """Read every subscription from Firestore and cache the result.
+
+        Polls and syncs keep writing while the stream runs; their cache writes are
+        re-applied to what was read, so a channel read before a write does not
+        bring back its older values.
+        """
+        with self._lock:
+            self._reloads_in_flight += 1
+            first_write = len(self._writes_during_reload)
+        try:
+            # Stream the projection so snapshots are parsed as they arrive, not buffered first
+            docs = self._db.collection('subscriptions').select(CHANNEL_FIELDS).stream()
+            channels = tuple(Channel.from_state_dict(doc.id, doc.to_dict()) for doc in docs)
+            self._increment_read_counter(len(channels))
 
             # Cache the results
-            self._channels_cache = channels
-            self._cache_timestamp = datetime.now()
-            print(f"[firebase] Cached {len(channels)} channels for {self._cache_ttl_minutes} minutes")
+            with self._lock:
+                channels = self._apply_cache_writes(channels, self._writes_during_reload[first_write:])
+                self._channels_cache = channels
+                self._known_channel_ids = frozenset(channel.channel_id for channel in channels)
+                self._cache_timestamp = datetime.now()
+                self._channels_load_failed = False
+        except Exception:
+            with self._lock:
+                self._channels_load_failed = True
+            raise
+        finally:
+            with self._lock:
+                self._reloads_in_flight -= 1
+                if not self._reloads_in_flight:
+                    self._writes_during_reload = []
+        self._log_current_stats()
+        logger.info("[firebase] Cached %s channels for %s minutes", len(channels), self._cache_ttl_minutes)
 
-            return channels
-        except Exception as e:
-            print(f"[firebase] Error getting channels: {e}")
-            return []
+        return channels
 
     def get_channel(self, channel_id: str) -> Channel:
         """Get a specific channel by ID."""
@@ -267,8 +594,9 @@ class FirebaseService:
             raise ValueError("Firebase not available")
 
         # First try to get from cache if valid
-        if self._is_cache_valid() and self._channels_cache:
-            for channel in self._channels_cache:
+        cached_channels = self._get_cached_channels()
+        if cached_channels:
+            for channel in cached_channels:
                 if channel.channel_id == channel_id:
                     return channel
             # If not in cache, channel doesn't exist
@@ -281,27 +609,9 @@ class FirebaseService:
             if not doc.exists:
                 raise KeyError(f"Channel {channel_id} not found")
 
-            data = doc.to_dict()
-
-            # Parse last_upload_at if it exists
-            last_upload_at = None
-            last_upload_str = data.get('last_upload_at')
-            if last_upload_str:
-                try:
-                    last_upload_at = datetime.fromisoformat(last_upload_str)
-                except (ValueError, TypeError):
-                    last_upload_at = None
-
-            return Channel(
-                channel_id=channel_id,
-                title=data.get('title', channel_id),
-                thumbnail=data.get('thumbnail'),
-                last_video_id=data.get('last_video_id', ''),
-                notify=data.get('notify', True),  # Default to True for backward compatibility
-                last_upload_at=last_upload_at
-            )
+            return Channel.from_state_dict(channel_id, doc.to_dict())
         except Exception as e:
-            print(f"[firebase] Error getting channel {channel_id}: {e}")
+            logger.error("[firebase] Error getting channel %s: %s", channel_id, e)
             raise
 
     def channel_exists(self, channel_id: str) -> bool:
@@ -309,34 +619,56 @@ class FirebaseService:
         if not self._db:
             return False
 
-        # First check cache if valid
-        if self._is_cache_valid() and self._channels_cache:
-            return any(channel.channel_id == channel_id for channel in self._channels_cache)
+        if channel_id in self._known_channel_ids:
+            return True
+
+        # A valid cache holds every stored channel, so a miss there is a definite no
+        if self._get_cached_channels():
+            return False
 
         try:
-            doc = self._db.collection('subscriptions').document(channel_id).get()
+            doc = self._db.collection('subscriptions').document(channel_id).get(field_paths=[])
             self._increment_read_counter()
             self._log_current_stats()
+            if doc.exists:
+                with self._lock:
+                    self._known_channel_ids |= {channel_id}
             return doc.exists
         except Exception as e:
-            print(f"[firebase] Error checking channel existence: {e}")
+            logger.error("[firebase] Error checking channel existence: %s", e)
             return False
 
     def channels_exist_batch(self, channel_ids: list[str]) -> dict[str, bool]:
-        """Check if multiple channels exist in Firebase using cached data when possible."""
+        """Check which of channel_ids exist in Firebase, keyed by channel ID.
+
+        Known IDs, or a valid cache (which holds every stored channel), answer without
+        reads; the rest are checked with batched get_all() reads of no fields. Raises
+        if a read fails, so unchecked channels are never reported as missing.
+        """
         if not self._db:
             return {channel_id: False for channel_id in channel_ids}
 
-        # If cache is valid, use it for all checks
-        if self._is_cache_valid() and self._channels_cache:
-            cached_ids = {channel.channel_id for channel in self._channels_cache}
-            return {channel_id: channel_id in cached_ids for channel_id in channel_ids}
+        known_ids = self._known_channel_ids
+        exists = {channel_id: channel_id in known_ids for channel_id in channel_ids}
+        unknown_ids = [channel_id for channel_id, found in exists.items() if not found]
+        if not unknown_ids or self._get_cached_channels():
+            return exists
 
-        # Otherwise fall back to individual checks (could be optimized further with batch gets)
-        results = {}
-        for channel_id in channel_ids:
-            results[channel_id] = self.channel_exists(channel_id)
-        return results
+        subscriptions_ref = self._db.collection('subscriptions')
+        try:
+            for start in range(0, len(unknown_ids), READ_BATCH_SIZE):
+                refs = [subscriptions_ref.document(channel_id)
+                        for channel_id in unknown_ids[start:start + READ_BATCH_SIZE]]
+                for snapshot in self._db.get_all(refs, field_paths=[]):
+                    exists[snapshot.id] = snapshot.exists
+                self._increment_read_counter(len(refs))
+            self._log_current_stats()
+        except Exception as e:
+            logger.error("[firebase] Error checking channel existence: %s", e)
+            raise
+        with self._lock:
+            self._known_channel_ids |= {channel_id for channel_id in unknown_ids if exists[channel_id]}
+        return exists
 
     def update_last_sync_time(self) -> bool:
         """Update the last subscription sync timestamp."""
@@ -346,12 +678,12 @@ class FirebaseService:
         try:
             self._db.collection('bot_state').document('sync_info').set({
                 'last_subs_sync': firestore.SERVER_TIMESTAMP
-            }, merge=True)
+            }, merge=True, retry=WRITE_RETRY)
             self._increment_write_counter()
             self._log_current_stats()
             return True
         except Exception as e:
-            print(f"[firebase] Error updating sync time: {e}")
+            logger.error("[firebase] Error updating sync time: %s", e)
             return False
 
     def update_channel_notify_preference(self, channel_id: str, notify: bool) -> bool:
@@ -363,17 +695,52 @@ class FirebaseService:
             self._db.collection('subscriptions').document(channel_id).update({
                 'notify': notify,
                 'last_updated': firestore.SERVER_TIMESTAMP
-            })
+            }, retry=WRITE_RETRY)
             self._increment_write_counter()
             self._log_current_stats()
-            # Invalidate cache since channel data changed
-            self._invalidate_cache()
-            print(f"[firebase] Updated notification preference for {channel_id}: {notify}")
+            # Keep the cached channel in step instead of reloading every channel
+            self._update_cached_channel(channel_id, notify=notify)
+            logger.info("[firebase] Updated notification preference for %s: %s", channel_id, notify)
             return True
         except Exception as e:
-            print(f"[firebase] Error updating notification preference: {e}")
+            logger.error("[firebase] Error updating notification preference: %s", e)
             return False
 
+    def update_and_return_channel(self, channel_id: str, notify: Optional[bool] = None) -> Channel:
+        """Set (or toggle, when notify is None) a channel's notify flag and return the updated channel.
+
+        The read and the write share one transaction, so callers need no separate get_channel.
+        """
+        if not self._db:
+            raise ValueError("Firebase not available")
+
+        doc_ref = self._db.collection('subscriptions').document(channel_id)
+
+        @firestore.transactional
+        def apply(transaction) -> dict:
+            snapshot = doc_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                raise KeyError(f"Channel {channel_id} not found")
+            data = snapshot.to_dict()
+            data['notify'] = not data.get('notify', True) if notify is None else notify
+            transaction.update(doc_ref, {
+                'notify': data['notify'],
+                'last_updated': firestore.SERVER_TIMESTAMP
+            })
+            return data
+
+        try:
+            data = apply(self._db.transaction())
+            self._increment_read_counter()
+            self._increment_write_counter()
+            self._log_current_stats()
+            self._update_cached_channel(channel_id, notify=data['notify'])
+            logger.info("[firebase] Updated notification preference for %s: %s", channel_id, data['notify'])
+            return Channel.from_state_dict(channel_id, data)
+        except Exception as e:
+            logger.error("[firebase] Error updating notification preference: %s", e)
+            raise
+
 
 class NullFirebaseService:
     """Null object pattern for when Firebase is not available."""
@@ -382,42 +749,62 @@ class NullFirebaseService:
     def is_available(self) -> bool:
         return False
 
+    @property
+    def channels_load_failed(self) -> bool:
+        return True
+
     def save_video(self, video: Video) -> bool:
-        print("[firebase] Firebase not available, skipping video save")
+        logger.warning("[firebase] Firebase not available, skipping video save")
         return False
 
     def save_subscription(self, channel: Channel) -> bool:
-        print("[firebase] Firebase not available, skipping subscription save")
+        logger.warning("[firebase] Firebase not available, skipping subscription save")
         return False
 
-    def update_channel_last_video(self, channel_id: str, video_id: str) -> bool:
-        print("[firebase] Firebase not available, skipping channel update")
+    def save_subscriptions_bulk(self, channels: Iterable[Channel]) -> int:
+        logger.warning("[firebase] Firebase not available, skipping subscription save")
+        return 0
+
+    def update_channel_last_video(self, channel_id: str, video_id: str,
+                                  last_upload_at: Optional[datetime] = None) -> bool:
+        logger.warning("[firebase] Firebase not available, skipping channel update")
         return False
 
-    def get_all_channels(self) -> list[Channel]:
-        print("[firebase] Firebase not available, returning empty channel list")
-        return []
+    def update_channel_fields_bulk(self, updates: Iterable[tuple[str, dict]]) -> int:
+        logger.warning("[firebase] Firebase not available, skipping subscription save")
+        return 0
+
+    def save_new_videos(self, updates: list[tuple[Channel, Video]]) -> set[str]:
+        logger.warning("[firebase] Firebase not available, skipping new videos save")
+        return set()
+
+    def get_all_channels(self) -> tuple[Channel, ...]:
+        logger.warning("[firebase] Firebase not available, returning empty channel list")
+        return ()
 
     def get_channel(self, channel_id: str) -> Channel:
-        print(f"[firebase] Firebase not available, cannot get channel {channel_id}")
+        logger.warning("[firebase] Firebase not available, cannot get channel %s", channel_id)
         raise ValueError("Firebase not available")
 
     def channel_exists(self, channel_id: str) -> bool:
-        print("[firebase] Firebase not available, assuming channel doesn't exist")
+        logger.warning("[firebase] Firebase not available, assuming channel doesn't exist")
         return False
 
     def channels_exist_batch(self, channel_ids: list[str]) -> dict[str, bool]:
-        print("[firebase] Firebase not available, assuming no channels exist")
+        logger.warning("[firebase] Firebase not available, assuming no channels exist")
         return {channel_id: False for channel_id in channel_ids}
 
     def update_last_sync_time(self) -> bool:
-        print("[firebase] Firebase not available, skipping sync time update")
+        logger.warning("[firebase] Firebase not available, skipping sync time update")
         return False
 
     def update_channel_notify_preference(self, channel_id: str, notify: bool) -> bool:
-        print(f"[firebase] Firebase not available, cannot update notification preference for {channel_id}")
+        logger.warning("[firebase] Firebase not available, cannot update notification preference for %s", channel_id)
         return False
 
+    def update_and_return_channel(self, channel_id: str, notify: Optional[bool] = None) -> Channel:
+        raise ValueError("Firebase not available")
+
     def get_daily_stats(self) -> dict[str, int]:
-        print("[firebase] Firebase not available, returning empty stats")
+        logger.warning("[firebase] Firebase not available, returning empty stats")
         return {'reads': 0, 'writes': 0, 'date': 'N/A'}
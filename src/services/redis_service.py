@@ -1,14 +1,48 @@
 """Redis service for storing video data and managing summaries."""
 
 import json
+import logging
+import time
 from datetime import datetime, timezone
-from typing import List, Optional
-from dataclasses import asdict
+from typing import Iterable, List, Optional, Tuple
 
 from upstash_redis import Redis
 
 from ..models.video import Video
 
+logger = logging.getLogger(__name__)
+
+# Keys expire after 7 days to prevent indefinite accumulation
+KEY_TTL_SECONDS = 604800
+
+# Pushes ARGV[3:] onto KEYS[1] and adds ARGV[2] to KEYS[2], refreshing both TTLs.
+# The REST client has no pipeline, so this keeps a whole poll's writes to one request.
+_STORE_VIDEOS_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+if #ARGV > 2 then
+    redis.call('LPUSH', KEYS[1], unpack(ARGV, 3))
+    redis.call('EXPIRE', KEYS[1], ttl)
+end
+local filtered = tonumber(ARGV[2])
+if filtered > 0 then
+    redis.call('INCRBY', KEYS[2], filtered)
+    redis.call('EXPIRE', KEYS[2], ttl)
+end
+return #ARGV - 2
+"""
+
+# Reads a day's stored videos and filtered count together
+_READ_SUMMARY_SCRIPT = """
+return {redis.call('LRANGE', KEYS[1], 0, -1), tonumber(redis.call('GET', KEYS[2]) or 0)}
+"""
+
+# Deletes a day's videos and filtered count, returning how many videos there were
+_CLEAR_SUMMARY_SCRIPT = """
+local count = redis.call('LLEN', KEYS[1])
+redis.call('DEL', KEYS[1], KEYS[2])
+return count
+"""
+
 
 class RedisService:
     """Service for managing video data in Redis with app-prefixed keys."""
@@ -18,8 +52,8 @@ class RedisService:
         self._app_name = app_name
         self._redis = None
         
-        print(f"[redis] Initializing Redis connection...")
-        print(f"[redis] App name: {app_name}")
+        logger.info("[redis] Initializing Redis connection...")
+        logger.info("[redis] App name: %s", app_name)
         
         try:
             # Parse Upstash Redis URL to extract components
@@ -46,58 +80,58 @@ class RedisService:
                             continue
                             
                         endpoint = f"https://{host}"
-                        print(f"[redis] Parsed endpoint: {host}")
-                        print(f"[redis] Token length: {len(token)} chars")
+                        logger.info("[redis] Parsed endpoint: %s", host)
+                        logger.info("[redis] Token length: %s chars", len(token))
                         
                         # Try both initialization methods
                         try:
                             self._redis = Redis(url=endpoint, token=token)
-                            print(f"[redis] Initialized with url/token parameters")
+                            logger.info("[redis] Initialized with url/token parameters")
                             parsed = True
                             break
                         except Exception as e1:
-                            print(f"[redis] url/token method failed: {e1}")
+                            logger.warning("[redis] url/token method failed: %s", e1)
                             try:
                                 # Try alternative initialization
                                 import os
                                 os.environ['UPSTASH_REDIS_REST_URL'] = endpoint
                                 os.environ['UPSTASH_REDIS_REST_TOKEN'] = token
                                 self._redis = Redis.from_env()
-                                print(f"[redis] Initialized with environment variables")
+                                logger.info("[redis] Initialized with environment variables")
                                 parsed = True
                                 break
                             except Exception as e2:
-                                print(f"[redis] Environment method failed: {e2}")
+                                logger.warning("[redis] Environment method failed: %s", e2)
                                 continue
                 
                 if not parsed:
-                    print(f"[redis] Could not parse Redis URL with any known pattern")
-                    print(f"[redis] URL format: {redis_url[:50]}...")
+                    logger.error("[redis] Could not parse Redis URL with any known pattern")
+                    logger.error("[redis] URL format: %s...", redis_url[:50])
                     raise ValueError(f"Unsupported Redis URL format")
                     
             else:
                 # Assume it's already an HTTPS endpoint
-                print(f"[redis] Treating as HTTPS endpoint: {redis_url}")
+                logger.info("[redis] Treating as HTTPS endpoint: %s", redis_url)
                 import os
                 
                 # Check if we have a separate token in environment
                 token = os.getenv('UPSTASH_REDIS_REST_TOKEN')
                 if token:
-                    print(f"[redis] Using separate token from UPSTASH_REDIS_REST_TOKEN")
+                    logger.info("[redis] Using separate token from UPSTASH_REDIS_REST_TOKEN")
                     self._redis = Redis(url=redis_url, token=token)
                 else:
-                    print(f"[redis] No separate token found, trying direct URL")
+                    logger.info("[redis] No separate token found, trying direct URL")
                     self._redis = Redis(url=redis_url)
                 
-            print(f"[redis] Redis client created successfully")
+            logger.info("[redis] Redis client created successfully")
             
         except Exception as e:
-            print(f"[redis] Error during Redis initialization: {e}")
-            print(f"[redis] This usually means:")
-            print(f"[redis]   1. Invalid UPSTASH_REDIS_URL format")
-            print(f"[redis]   2. Incorrect token or endpoint")
-            print(f"[redis]   3. Network connectivity issues")
-            print(f"[redis] Please check your Upstash console for the correct URL")
+            logger.error("[redis] Error during Redis initialization: %s", e)
+            logger.error("[redis] This usually means:")
+            logger.error("[redis]   1. Invalid UPSTASH_REDIS_URL format")
+            logger.error("[redis]   2. Incorrect token or endpoint")
+            logger.error("[redis]   3. Network connectivity issues")
+            logger.error("[redis] Please check your Upstash console for the correct URL")
             self._redis = None
 
     def _get_videos_key(self, date_str: Optional[str] = None) -> str:
@@ -117,43 +151,78 @@ class RedisService:
         try:
             key = self._get_videos_key()
             video_data = {
-                **asdict(video),
-                "stored_at": datetime.now(timezone.utc).isoformat()
+                **video.to_dict(),
+                "stored_at": int(time.time())  # Epoch seconds
             }
             
             # Add video to the list for today
-            self._redis.lpush(key, json.dumps(video_data))
+            self._redis.lpush(key, json.dumps(video_data, ensure_ascii=False, separators=(",", ":")))
             
             # Set expiry to 7 days to prevent indefinite accumulation
-            self._redis.expire(key, 604800)  # 7 days in seconds
+            self._redis.expire(key, KEY_TTL_SECONDS)
             
         except Exception as e:
-            print(f"[redis] Error storing video {video.video_id}: {e}")
+            logger.error("[redis] Error storing video %s: %s", video.video_id, e)
+
+    def store_videos(self, videos: Iterable[Video], filtered_count: int = 0) -> None:
+        """Store several videos, and optionally bump the filtered count, in one round trip."""
+        stored_at = int(time.time())
+        payloads = [
+            json.dumps({**video.to_dict(), "stored_at": stored_at}, ensure_ascii=False, separators=(",", ":"))
+            for video in videos
+        ]
+        if not payloads and filtered_count <= 0:
+            return
+
+        try:
+            self._redis.eval(
+                _STORE_VIDEOS_SCRIPT,
+                keys=[self._get_videos_key(), self._get_filtered_count_key()],
+                args=[KEY_TTL_SECONDS, filtered_count, *payloads]
+            )
+        except Exception as e:
+            logger.error("[redis] Error storing %s videos: %s", len(payloads), e)
 
     def get_stored_videos(self, date_str: Optional[str] = None) -> List[Video]:
         """Retrieve all stored videos for a given date."""
         try:
             key = self._get_videos_key(date_str)
-            video_data_list = self._redis.lrange(key, 0, -1)
-            
-            videos = []
-            for video_data in video_data_list:
-                try:
-                    data = json.loads(video_data)
-                    # Remove stored_at field before creating Video object
-                    data.pop('stored_at', None)
-                    video = Video(**data)
-                    videos.append(video)
-                except (json.JSONDecodeError, TypeError) as e:
-                    print(f"[redis] Error parsing video data: {e}")
-                    continue
-            
-            return videos
+            return self._parse_videos(self._redis.lrange(key, 0, -1))
             
         except Exception as e:
-            print(f"[redis] Error retrieving videos: {e}")
+            logger.error("[redis] Error retrieving videos: %s", e)
             return []
 
+    def get_summary_data(self, date_str: Optional[str] = None) -> Tuple[List[Video], int]:
+        """Retrieve a date's stored videos and filtered count in one round trip."""
+        try:
+            video_data_list, filtered_count = self._redis.eval(
+                _READ_SUMMARY_SCRIPT,
+                keys=[self._get_videos_key(date_str), self._get_filtered_count_key(date_str)]
+            )
+            return self._parse_videos(video_data_list or []), int(filtered_count or 0)
+
+        except Exception as e:
+            logger.error("[redis] Error retrieving summary data: %s", e)
+            return [], 0
+
+    @staticmethod
+    def _parse_videos(video_data_list: List[str]) -> List[Video]:
+        """Decode stored video JSON entries, skipping malformed ones."""
+        videos = []
+        for video_data in video_data_list:
+            try:
+                data = json.loads(video_data)
+                # Remove stored_at field before creating Video object
+                data.pop('stored_at', None)
+                video = Video(**data)
+                videos.append(video)
+            except (json.JSONDecodeError, TypeError) as e:
+                logger.error("[redis] Error parsing video data: %s", e)
+                continue
+        
+        return videos
+
     def increment_filtered_count(self, count: int = 1, date_str: Optional[str] = None) -> None:
         """Increment the filtered video count for a given date."""
         try:
@@ -161,10 +230,10 @@ class RedisService:
             self._redis.incrby(key, count)
             
             # Set expiry to 7 days to prevent indefinite accumulation
-            self._redis.expire(key, 604800)  # 7 days in seconds
+            self._redis.expire(key, KEY_TTL_SECONDS)
             
         except Exception as e:
-            print(f"[redis] Error incrementing filtered count: {e}")
+            logger.error("[redis] Error incrementing filtered count: %s", e)
 
     def get_filtered_count(self, date_str: Optional[str] = None) -> int:
         """Get count of filtered videos for a given date."""
@@ -173,22 +242,21 @@ class RedisService:
             return int(self._redis.get(key) or 0)
             
         except Exception as e:
-            print(f"[redis] Error getting filtered count: {e}")
+            logger.error("[redis] Error getting filtered count: %s", e)
             return 0
 
     def clear_stored_videos(self, date_str: Optional[str] = None) -> int:
         """Clear all stored videos for a given date and return count of cleared items."""
         try:
-            videos_key = self._get_videos_key(date_str)
-            filtered_key = self._get_filtered_count_key(date_str)
-            
-            count = self._redis.llen(videos_key) or 0
-            self._redis.delete(videos_key)
-            self._redis.delete(filtered_key)  # Also clear filtered count
-            return count
+            # Also clears the filtered count, in the same round trip
+            count = self._redis.eval(
+                _CLEAR_SUMMARY_SCRIPT,
+                keys=[self._get_videos_key(date_str), self._get_filtered_count_key(date_str)]
+            )
+            return int(count or 0)
             
         except Exception as e:
-            print(f"[redis] Error clearing videos: {e}")
+            logger.error("[redis] Error clearing videos: %s", e)
             return 0
 
     def get_video_count(self, date_str: Optional[str] = None) -> int:
@@ -198,13 +266,13 @@ class RedisService:
             return self._redis.llen(key) or 0
             
         except Exception as e:
-            print(f"[redis] Error getting video count: {e}")
+            logger.error("[redis] Error getting video count: %s", e)
             return 0
 
     def is_available(self) -> bool:
         """Check if Redis connection is available."""
         if self._redis is None:
-            print("[redis] Redis client is None - initialization failed")
+            logger.error("[redis] Redis client is None - initialization failed")
             return False
             
         try:
@@ -214,12 +282,12 @@ class RedisService:
             self._redis.set(test_key, "test", ex=10)  # Set with 10 second expiry
             result = self._redis.get(test_key)
             if result == "test":
-                print("[redis] Connection test successful")
+                logger.info("[redis] Connection test successful")
                 self._redis.delete(test_key)  # Clean up test key
                 return True
             else:
-                print(f"[redis] Connection test failed - unexpected result: {result}")
+                logger.error("[redis] Connection test failed - unexpected result: %s", result)
                 return False
         except Exception as e:
-            print(f"[redis] Connection test failed with error: {e}")
+            logger.error("[redis] Connection test failed with error: %s", e)
             return False
\ No newline at end of file
@@ -1,10 +1,19 @@
 """Telegram notification service."""
 
+import logging
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, List
 
 from ..models.video import Video
 
+logger = logging.getLogger(__name__)
+
+# How many times a message is resent after Telegram answers 429 Too Many Requests
+RATE_LIMIT_RETRIES = 2
+
 
 class TelegramService:
     """Service for sending Telegram notifications."""
@@ -13,6 +22,26 @@ class TelegramService:
         self._bot_token = bot_token
         self._chat_id = chat_id
         self._base_url = f"https://api.telegram.org/bot{bot_token}"
+        self._session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a keep-alive session so sends reuse the TLS connection to Telegram.
+
+        Only connection failures are retried: sendMessage is not idempotent, so after
+        a read error or a 5xx Telegram may already have delivered the message.
+        """
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=0,
+            status=0,  # 429 is handled in send_message
+            backoff_factor=0.3,
+            raise_on_status=False
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        return session
 
     def send_message(self, text: str) -> bool:
         """Send a text message."""
@@ -25,13 +54,29 @@ class TelegramService:
         }
 
         try:
-            response = requests.post(url, data=data, timeout=15)
+            response = self._session.post(url, data=data, timeout=15)
+            for _ in range(RATE_LIMIT_RETRIES):
+                if response.status_code != 429:
+                    break
+                # Flood control: wait as long as Telegram asks before retrying
+                retry_after = self._get_retry_after(response)
+                logger.warning("[telegram] Rate limited, retrying in %ss", retry_after)
+                time.sleep(retry_after)
+                response = self._session.post(url, data=data, timeout=15)
             response.raise_for_status()
             return True
         except Exception as e:
-            print(f"[telegram] Error sending message: {e}")
+            logger.error("[telegram] Error sending message: %s", e)
             return False
 
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> float:
+        """Get the wait time Telegram requested for a 429 response."""
+        try:
+            return float(response.json()["parameters"]["retry_after"])
+        except (ValueError, KeyError, TypeError):
+            return float(response.headers.get("Retry-After", 1))
+
     def send_startup_message(self, user_info: Optional[str], subscription_count: int, config_info: str) -> bool:
         """Send bot startup notification."""
         if user_info:
@@ -0,0 +1,163 @@
+"""WebSub (PubSubHubbub) push listener for YouTube upload notifications."""
+
+import hashlib
+import hmac
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from flask import Flask, request
+from werkzeug.serving import make_server
+
+from ..models.video import ATOM_NS, Video, iter_atom_entries
+
+logger = logging.getLogger(__name__)
+
+HUB_URL = "https://pubsubhubbub.appspot.com/subscribe"
+TOPIC_URL = "https://www.youtube.com/xml/feeds/videos.xml?channel_id={channel_id}"
+TOPIC_PREFIX = "https://www.youtube.com/xml/feeds/videos.xml"
+# Modes the hub verifies intent for
+VERIFY_MODES = {"subscribe", "unsubscribe"}
+
+LEASE_SECONDS = 5 * 24 * 3600
+# Leases are renewed on their own timer, well before they lapse, whatever CHANNEL_CRON is
+LEASE_RENEWAL_SECONDS = LEASE_SECONDS // 2
+# Concurrent subscription requests to the hub
+SUBSCRIBE_WORKERS = 8
+
+
+class WebSubServer:
+    """Receives YouTube push notifications and subscribes channels at the hub."""
+
+    def __init__(self, callback_url: str, port: int,
+                 on_video: Callable[[str, Video], None], secret: str,
+                 is_known_channel: Callable[[str], bool]):
+        """Initialize WebSub server.
+
+        Args:
+            callback_url: Public URL the hub POSTs notifications to
+            port: Local port to listen on
+            on_video: Called with (channel_id, video) for every pushed entry
+            secret: Shared secret used to verify X-Hub-Signature; unsigned
+                notifications are ignored
+            is_known_channel: Tells whether a channel ID is one of ours; the hub's
+                verification requests for other topics are refused
+        """
+        if not secret:
+            raise ValueError("A WebSub secret is required to verify pushed notifications")
+        self.callback_url = callback_url
+        self.port = port
+        self.secret = secret
+        # Serve the callback on the path of the public URL
+        self.path = urlparse(callback_url).path or '/'
+        self._on_video = on_video
+        self._is_known_channel = is_known_channel
+        self._session = requests.Session()
+        # Reused by every subscribe_all(), i.e. each sync and lease renewal
+        self._executor = ThreadPoolExecutor(max_workers=SUBSCRIBE_WORKERS, thread_name_prefix="websub")
+        self._server = None
+        self._server_thread = None
+
+    def _create_flask_app(self) -> Flask:
+        """Create Flask application with the WebSub callback endpoint."""
+        app = Flask(__name__)
+
+        @app.route(self.path, methods=['GET'])
+        def verify():
+            """Answer the hub's subscription verification challenge."""
+            mode = request.args.get('hub.mode')
+            challenge = request.args.get('hub.challenge')
+            channel_id = self._topic_channel_id(request.args.get('hub.topic', ''))
+            if mode not in VERIFY_MODES or not challenge or not channel_id:
+                return 'Unknown topic', 404
+            if not self._is_known_channel(channel_id):
+                logger.warning("[websub] Refusing %s verification for unknown channel %s", mode, channel_id)
+                return 'Unknown topic', 404
+            return challenge, 200
+
+        @app.route(self.path, methods=['POST'])
+        def notify():
+            """Handle a pushed Atom feed."""
+            body = request.get_data()
+            if not self._is_signature_valid(body, request.headers.get('X-Hub-Signature', '')):
+                # Spec: acknowledge with 2xx but ignore the content
+                logger.warning("[websub] Ignoring notification with invalid signature")
+                return '', 204
+
+            # Parsed like polled feeds, so both paths build identical videos
+            try:
+                for entry in iter_atom_entries(body):
+                    channel_id = entry.findtext("yt:channelId", namespaces=ATOM_NS)
+                    if not channel_id:
+                        continue
+                    try:
+                        self._on_video(channel_id, Video.from_atom_entry(entry, channel_id))
+                    except Exception as e:
+                        logger.error("[websub] Error handling notification for %s: %s", channel_id, e)
+            except ET.ParseError as e:
+                logger.warning("[websub] Ignoring malformed notification: %s", e)
+            return '', 204
+
+        return app
+
+    @staticmethod
+    def _topic_channel_id(topic: str) -> str:
+        """Channel ID of a YouTube upload feed topic, or '' for any other topic."""
+        parsed = urlparse(topic)
+        if f"{parsed.scheme}://{parsed.netloc}{parsed.path}" != TOPIC_PREFIX:
+            return ''
+        return parse_qs(parsed.query).get('channel_id', [''])[0]
+
+    def _is_signature_valid(self, body: bytes, signature: str) -> bool:
+        """Check the hub's HMAC signature against the shared secret."""
+        method, _, digest = signature.partition('=')
+        if method not in ('sha1', 'sha256', 'sha384', 'sha512'):
+            return False
+        expected = hmac.new(self.secret.encode(), body, getattr(hashlib, method)).hexdigest()
+        return hmac.compare_digest(expected, digest)
+
+    def start(self) -> None:
+        """Start the listener in a background thread."""
+        self._server = make_server('0.0.0.0', self.port, self._create_flask_app(), threaded=True)
+        self._server_thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._server_thread.start()
+        logger.info("[websub] Listening on port %s, callback URL: %s", self.port, self.callback_url)
+
+    def stop(self) -> None:
+        """Stop the listener and drop any subscription requests not yet sent."""
+        if self._server:
+            try:
+                self._server.shutdown()
+                logger.info("[websub] WebSub server stopped")
+            except Exception as e:
+                logger.error("[websub] Error stopping WebSub server: %s", e)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def subscribe(self, channel_id: str) -> bool:
+        """Subscribe (or renew the lease) for one channel's upload feed."""
+        data = {
+            'hub.mode': 'subscribe',
+            'hub.topic': TOPIC_URL.format(channel_id=channel_id),
+            'hub.callback': self.callback_url,
+            'hub.verify': 'async',
+            'hub.lease_seconds': LEASE_SECONDS,
+            'hub.secret': self.secret
+        }
+
+        try:
+            response = self._session.post(HUB_URL, data=data, timeout=15)
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.error("[websub] Error subscribing to %s: %s", channel_id, e)
+            return False
+
+    def subscribe_all(self, channel_ids: Iterable[str]) -> int:
+        """Subscribe a set of channels. Returns the number of accepted requests."""
+        accepted = sum(self._executor.map(self.subscribe, channel_ids))
+        logger.info("[websub] Subscribed %s channels at the hub", accepted)
+        return accepted
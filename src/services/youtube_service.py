@@ -1,24 +1,30 @@
 """YouTube API service."""
 
+import hashlib
+import logging
 import os
-from typing import List, Tuple, Optional
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, Sequence, Tuple, Optional
 from datetime import datetime, timedelta
 from googleapiclient.discovery import build
 from google_auth_oauthlib.flow import InstalledAppFlow, Flow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google.auth.exceptions import RefreshError
-import feedparser
+import requests
+from requests.adapters import HTTPAdapter
 
 from ..models.channel import UserChannelInfo, Channel
-from ..models.video import Video
+from ..models.video import Video, iter_atom_entries
 from .oauth_server import run_oauth_flow
 
+logger = logging.getLogger(__name__)
+
 
 class YouTubeService:
     """Service for YouTube API operations."""
     
-    def __init__(self, client_secret_file: str, token_file: str, scopes: List[str], 
+    def __init__(self, client_secret_file: str, token_file: str, scopes: Sequence[str], 
                  oauth_port: int = 8080, oauth_timeout: int = 300, oauth_auto_browser: bool = True,
                  oauth_callback_domain: Optional[str] = None, oauth_use_ssl: bool = False,
                  oauth_ssl_cert_path: Optional[str] = None, oauth_ssl_key_path: Optional[str] = None):
@@ -26,6 +32,8 @@ class YouTubeService:
         self._token_file = token_file
         self._scopes = scopes
         self._client = None
+        self._credentials = None
+        self._saved_token = None  # Access token of self._credentials last written to the token file
         self._oauth_port = oauth_port
         self._oauth_timeout = oauth_timeout
         self._oauth_auto_browser = oauth_auto_browser
@@ -42,13 +50,14 @@ class YouTubeService:
             if datetime.now() - self._last_token_check < timedelta(minutes=30):
                 return self._client
         
-        creds = None
-        if os.path.exists(self._token_file):
+        # Reuse in-memory credentials; the token file is only read on first use
+        creds = self._credentials
+        if creds is None and os.path.exists(self._token_file):
             try:
                 creds = Credentials.from_authorized_user_file(self._token_file, self._scopes)
-                print(f"[youtube] Loaded credentials from {self._token_file}")
+                logger.info("[youtube] Loaded credentials from %s", self._token_file)
             except Exception as e:
-                print(f"[youtube] Error loading token file: {e}")
+                logger.error("[youtube] Error loading token file: %s", e)
                 creds = None
         
         # Enhanced credential validation and refresh logic
@@ -57,7 +66,7 @@ class YouTubeService:
             if creds_refreshed:
                 creds = creds_refreshed
             elif not creds.valid:
-                print("[youtube] Credentials invalid and refresh failed, need new authentication")
+                logger.error("[youtube] Credentials invalid and refresh failed, need new authentication")
                 creds = None
         
         # If no valid credentials, start new authentication flow
@@ -67,16 +76,23 @@ class YouTubeService:
         # Save updated credentials and create client
         if creds:
             try:
-                with open(self._token_file, "w") as f:
-                    f.write(creds.to_json())
-                print(f"[youtube] Saved updated credentials to {self._token_file}")
+                # Skip the write on steady-state checks where the in-memory token did not change
+                if creds is not self._credentials or creds.token != self._saved_token:
+                    with open(self._token_file, "w") as f:
+                        f.write(creds.to_json())
+                    self._saved_token = creds.token
+                    logger.info("[youtube] Saved updated credentials to %s", self._token_file)
                 
-                self._client = build("youtube", "v3", credentials=creds)
+                # The client holds a reference to creds, so in-place refreshes need no rebuild
+                if self._client is None or creds is not self._credentials:
+                    self._client = build("youtube", "v3", credentials=creds,
+                                         cache_discovery=False, static_discovery=True)
+                    logger.info("[youtube] YouTube API client initialized successfully")
+                self._credentials = creds
                 self._last_token_check = datetime.now()
-                print("[youtube] YouTube API client initialized successfully")
                 return self._client
             except Exception as e:
-                print(f"[youtube] Error saving credentials or building client: {e}")
+                logger.error("[youtube] Error saving credentials or building client: %s", e)
                 raise
         
         raise Exception("Failed to obtain valid YouTube API credentials")
@@ -91,53 +107,54 @@ class YouTubeService:
         if creds.expiry:
             expires_soon = creds.expiry <= now + timedelta(minutes=5)
             if expires_soon:
-                print(f"[youtube] Token expires at {creds.expiry}, refreshing proactively...")
+                logger.info("[youtube] Token expires at %s, refreshing proactively...", creds.expiry)
             elif creds.expired:
-                print("[youtube] Token has expired, attempting refresh...")
+                logger.info("[youtube] Token has expired, attempting refresh...")
         
         # If credentials are invalid or will expire soon, try to refresh
         if not creds.valid or (creds.expiry and creds.expiry <= now + timedelta(minutes=5)):
             if creds.refresh_token:
                 try:
-                    print("[youtube] Refreshing access token...")
+                    logger.info("[youtube] Refreshing access token...")
                     creds.refresh(Request())
-                    print(f"[youtube] Token refreshed successfully, expires at: {creds.expiry}")
+                    logger.info("[youtube] Token refreshed successfully, expires at: %s", creds.expiry)
                     return creds
                 except RefreshError as e:
-                    print(f"[youtube] Refresh failed: {e}")
-                    print("[youtube] Refresh token may be invalid, need new authentication")
+                    logger.error("[youtube] Refresh failed: %s", e)
+                    logger.error("[youtube] Refresh token may be invalid, need new authentication")
                     return None
                 except Exception as e:
-                    print(f"[youtube] Unexpected error during refresh: {e}")
+                    logger.error("[youtube] Unexpected error during refresh: %s", e)
                     return None
             else:
-                print("[youtube] No refresh token available, need new authentication")
+                logger.info("[youtube] No refresh token available, need new authentication")
                 return None
         
         # Credentials are valid and not expiring soon
         if creds.expiry:
             time_until_expiry = creds.expiry - now
-            print(f"[youtube] Token valid, expires in {time_until_expiry}")
+            logger.info("[youtube] Token valid, expires in %s", time_until_expiry)
         else:
-            print("[youtube] Token valid (no expiry info)")
+            logger.info("[youtube] Token valid (no expiry info)")
         
         return creds
     
     def _perform_new_authentication(self):
         """Perform new OAuth authentication flow using web server."""
         try:
-            print("[youtube] Starting automated OAuth authentication flow...")
+            logger.info("[youtube] Starting automated OAuth authentication flow...")
             
             # Try web-based OAuth flow first
             
             # Show configuration info
             if self._oauth_callback_domain:
                 scheme = 'https' if self._oauth_use_ssl else 'http'
-                print(f"[youtube] Using domain callback: {scheme}://{self._oauth_callback_domain}:{self._oauth_port}/oauth2callback")
+                logger.info("[youtube] Using domain callback: %s://%s:%s/oauth2callback",
+                            scheme, self._oauth_callback_domain, self._oauth_port)
                 if self._oauth_use_ssl:
-                    print(f"[youtube] SSL enabled with certificate: {self._oauth_ssl_cert_path}")
+                    logger.info("[youtube] SSL enabled with certificate: %s", self._oauth_ssl_cert_path)
             else:
-                print(f"[youtube] Using localhost callback on port {self._oauth_port}")
+                logger.info("[youtube] Using localhost callback on port %s", self._oauth_port)
             
             credentials_dict = run_oauth_flow(
                 self._client_secret_file,
@@ -166,22 +183,22 @@ class YouTubeService:
                 if credentials_dict.get('expiry'):
                     creds.expiry = datetime.fromisoformat(credentials_dict['expiry'])
                 
-                print(f"[youtube] Web-based authentication successful, expires at: {creds.expiry}")
+                logger.info("[youtube] Web-based authentication successful, expires at: %s", creds.expiry)
                 return creds
             
             # Fallback to manual flow if web flow fails
-            print("[youtube] Web-based OAuth failed, falling back to manual flow...")
+            logger.error("[youtube] Web-based OAuth failed, falling back to manual flow...")
             return self._perform_manual_authentication()
             
         except Exception as e:
-            print(f"[youtube] Automated authentication flow failed: {e}")
-            print("[youtube] Falling back to manual authentication...")
+            logger.error("[youtube] Automated authentication flow failed: %s", e)
+            logger.info("[youtube] Falling back to manual authentication...")
             return self._perform_manual_authentication()
     
     def _perform_manual_authentication(self):
         """Perform manual OAuth authentication flow as fallback."""
         try:
-            print("[youtube] Starting manual authentication flow...")
+            logger.info("[youtube] Starting manual authentication flow...")
             flow = InstalledAppFlow.from_client_secrets_file(
                 self._client_secret_file, self._scopes
             )
@@ -198,11 +215,11 @@ class YouTubeService:
             flow.fetch_token(code=auth_code)
             creds = flow.credentials
             
-            print(f"[youtube] Manual authentication successful, expires at: {creds.expiry}")
+            logger.info("[youtube] Manual authentication successful, expires at: %s", creds.expiry)
             return creds
             
         except Exception as e:
-            print(f"[youtube] Manual authentication flow failed: {e}")
+            logger.error("[youtube] Manual authentication flow failed: %s", e)
             return None
     
     def get_user_channel_info(self) -> Optional[UserChannelInfo]:
@@ -225,16 +242,15 @@ class YouTubeService:
         except Exception as e:
             return self._handle_api_error("get_user_channel_info", e)
     
-    def fetch_all_subscriptions(self) -> List[Tuple[str, str, Optional[str]]]:
-        """Fetch all user subscriptions with thumbnails."""
-        items: List[Tuple[str, str, Optional[str]]] = []
+    def fetch_all_subscriptions(self) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Yield all user subscriptions with thumbnails, one API page at a time."""
         page_token = None
         
         try:
             youtube = self._get_authenticated_client()
         except Exception as e:
-            print(f"[youtube] Failed to get authenticated client for subscriptions: {e}")
-            return items
+            logger.error("[youtube] Failed to get authenticated client for subscriptions: %s", e)
+            return
         
         while True:
             try:
@@ -262,7 +278,7 @@ class YouTubeService:
                                 break
                     
                     if channel_id:
-                        items.append((channel_id, title, thumbnail_url))
+                        yield channel_id, title, thumbnail_url
                 
                 page_token = resp.get("nextPageToken")
                 if not page_token:
@@ -273,15 +289,13 @@ class YouTubeService:
                 if error_handled is None:  # Auth error, stop trying
                     break
                 # For other errors, log and continue
-                print(f"[youtube] Error fetching subscriptions page, continuing: {e}")
+                logger.error("[youtube] Error fetching subscriptions page, continuing: %s", e)
                 break
-        
-        return items
     
     def _handle_api_error(self, operation: str, error: Exception):
         """Handle API errors with intelligent retry logic."""
         error_str = str(error)
-        print(f"[youtube] Error in {operation}: {error}")
+        logger.error("[youtube] Error in %s: %s", operation, error)
         
         # Check for authentication-related errors
         auth_errors = [
@@ -293,17 +307,17 @@ class YouTubeService:
         ]
         
         if any(auth_error in error_str.lower() for auth_error in auth_errors):
-            print("[youtube] Authentication error detected, clearing client cache...")
+            logger.error("[youtube] Authentication error detected, clearing client cache...")
             self._client = None
             
             # Try once more with fresh authentication
             try:
-                print("[youtube] Attempting to re-authenticate...")
+                logger.info("[youtube] Attempting to re-authenticate...")
                 youtube = self._get_authenticated_client()
-                print("[youtube] Re-authentication successful")
+                logger.info("[youtube] Re-authentication successful")
                 return "retry"  # Signal caller to retry the operation
             except Exception as retry_error:
-                print(f"[youtube] Re-authentication failed: {retry_error}")
+                logger.error("[youtube] Re-authentication failed: %s", retry_error)
                 return None  # Signal permanent failure
         
         # For non-auth errors, just log and return None
@@ -313,17 +327,55 @@ class YouTubeService:
 class RSSService:
     """Service for RSS feed operations."""
 
-    @staticmethod
-    def get_latest_video(channel: Channel) -> Optional[Video]:
-        """Get latest video from channel's RSS feed."""
-        try:
-            feed = feedparser.parse(channel.rss_url)
-            if not feed.entries:
-                return None
+    def __init__(self):
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
+        # channel_id -> (ETag, Last-Modified) from the last successful fetch
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # channel_id -> digest of the last feed body that was parsed
+        self._feed_signatures: Dict[str, str] = {}
 
-            latest = feed.entries[0]
-            return Video.from_rss_entry(latest, channel.channel_id)
+    def get_latest_video(self, channel: Channel) -> Optional[Video]:
+        """Get latest video from channel's RSS feed.
 
-        except Exception as e:
-            print(f"[rss] Error parsing {channel.rss_url}: {e}")
-            return None
\ No newline at end of file
+        Uses a conditional GET and a digest of the body, so None is also returned
+        when the feed has not changed since the previous poll. A failed fetch
+        raises, so callers can tell it apart from an unchanged feed.
+        """
+        headers = {}
+        etag, last_modified = self._validators.get(channel.channel_id, (None, None))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self._session.get(channel.rss_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        # Skip the parse when the body is byte-identical to the last one
+        signature = hashlib.blake2b(response.content, digest_size=8).hexdigest()
+        if self._feed_signatures.get(channel.channel_id) == signature:
+            return None
+
+        latest = self._first_entry(response.content)
+        video = Video.from_atom_entry(latest, channel.channel_id) if latest is not None else None
+
+        # Only remember the feed once it parsed, so a bad body is fetched again
+        self._validators[channel.channel_id] = (
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified")
+        )
+        self._feed_signatures[channel.channel_id] = signature
+        return video
+
+    def forget(self, channel_id: str) -> None:
+        """Drop a channel's cached validators so its next fetch is parsed in full."""
+        self._validators.pop(channel_id, None)
+        self._feed_signatures.pop(channel_id, None)
+
+    @staticmethod
+    def _first_entry(content: bytes) -> Optional[ET.Element]:
+        """Return the first <entry> of a YouTube Atom feed, without parsing the rest."""
+        return next(iter_atom_entries(content), None)
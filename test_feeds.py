@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test script for YouTube Atom feed parsing and conditional RSS fetches.
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import feedparser
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.models.channel import Channel
+from src.models.video import Video
+from src.services.youtube_service import RSSService
+
+
+def make_entry(video_id: str, published: str) -> str:
+    return f"""
+ <entry>
+  <id>yt:video:{video_id}</id>
+  <yt:videoId>{video_id}</yt:videoId>
+  <yt:channelId>UC1</yt:channelId>
+  <title>Video {video_id} &amp; more</title>
+  <link rel="alternate" href="https://www.youtube.com/watch?v={video_id}"/>
+  <author><name>Channel</name></author>
+  <published>{published}</published>
+  <updated>2024-01-02T00:00:00+00:00</updated>
+  <media:group>
+   <media:title>Video {video_id}</media:title>
+   <media:thumbnail url="https://i.ytimg.com/vi/{video_id}/hqdefault.jpg" width="480" height="360"/>
+  </media:group>
+ </entry>"""
+
+
+def make_feed(*entries: str) -> bytes:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">
+ <link rel="self" href="https://www.youtube.com/feeds/videos.xml?channel_id=UC1"/>
+ <id>yt:channel:UC1</id>
+ <yt:channelId>UC1</yt:channelId>
+ <title>Channel</title>{''.join(entries)}
+</feed>""".encode()
+
+
+FEED = make_feed(make_entry("newest", "2024-01-01T12:30:45+00:00"),
+                 make_entry("older", "2023-12-31T08:00:00+00:00"))
+
+
+def make_response(status_code: int = 200, content: bytes = FEED, headers: dict = None) -> Mock:
+    response = Mock(status_code=status_code, content=content, headers=headers or {})
+    response.raise_for_status = Mock()
+    if status_code >= 400:
+        response.raise_for_status.side_effect = RuntimeError(f"HTTP {status_code}")
+    return response
+
+
+def test_atom_rss_parity():
+    """Test that the iterparse path builds the same Video as feedparser does."""
+    print("Testing Atom/feedparser parity...")
+
+    first = RSSService._first_entry(FEED)
+    from_atom = Video.from_atom_entry(first, "UC1")
+    from_rss = Video.from_rss_entry(feedparser.parse(FEED).entries[0], "UC1")
+
+    assert from_atom == from_rss
+    assert from_atom.video_id == "newest"
+    assert from_atom.title == "Video newest & more"
+    assert from_atom.thumbnail == "https://i.ytimg.com/vi/newest/hqdefault.jpg"
+    assert from_atom.published_at == "2024-01-01T12:30:45+00:00"
+    print("✅ Both parsers produce the same video")
+
+    # Offsets are normalised to UTC, as feedparser does
+    shifted = RSSService._first_entry(make_feed(make_entry("v", "2024-01-01T20:30:45+08:00")))
+    assert Video.from_atom_entry(shifted, "UC1").published_at == "2024-01-01T12:30:45+00:00"
+    print("✅ Published times are converted to UTC")
+
+
+def test_first_entry():
+    """Test that only the first entry is returned, and None for an empty feed."""
+    print("Testing first entry extraction...")
+
+    assert Video.from_atom_entry(RSSService._first_entry(FEED), "UC1").video_id == "newest"
+    assert RSSService._first_entry(make_feed()) is None
+    print("✅ First entry found, empty feed yields None")
+
+
+def test_conditional_fetch():
+    """Test the ETag/Last-Modified validators and the unchanged-body skip."""
+    print("Testing conditional RSS fetches...")
+
+    service = RSSService()
+    service._session = Mock()
+    channel = Channel(channel_id="UC1", title="Channel")
+
+    service._session.get.return_value = make_response(headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"})
+    assert service.get_latest_video(channel).video_id == "newest"
+    assert service._session.get.call_args.kwargs['headers'] == {}
+
+    # The validators of the last parsed feed are sent back
+    service._session.get.return_value = make_response(status_code=304, content=b"")
+    assert service.get_latest_video(channel) is None
+    assert service._session.get.call_args.kwargs['headers'] == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024"
+    }
+    print("✅ 304 Not Modified returns None")
+
+    # A server without validators sending the same body is not parsed again
+    service._session.get.return_value = make_response()
+    assert service.get_latest_video(channel) is None
+    print("✅ Unchanged body is skipped")
+
+    # forget() makes the next fetch unconditional and parsed in full
+    service.forget("UC1")
+    assert service.get_latest_video(channel).video_id == "newest"
+    assert service._session.get.call_args.kwargs['headers'] == {}
+    print("✅ forget() drops the cached validators")
+
+
+def test_failed_fetch():
+    """Test that failures raise and leave no validators behind."""
+    print("Testing failed RSS fetches...")
+
+    service = RSSService()
+    service._session = Mock()
+    channel = Channel(channel_id="UC1", title="Channel")
+
+    service._session.get.return_value = make_response(status_code=500)
+    try:
+        service.get_latest_video(channel)
+        assert False, "expected an HTTP error"
+    except RuntimeError:
+        pass
+
+    service._session.get.return_value = make_response(content=b"<feed><entry>", headers={"ETag": '"bad"'})
+    try:
+        service.get_latest_video(channel)
+        assert False, "expected a parse error"
+    except Exception:
+        pass
+    assert "UC1" not in service._validators and "UC1" not in service._feed_signatures
+    print("✅ Errors raise without caching the bad feed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Testing Feed Parsing")
+    print("=" * 60)
+
+    try:
+        test_atom_rss_parity()
+        test_first_entry()
+        test_conditional_fetch()
+        test_failed_fetch()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! Feed parsing is working correctly.")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
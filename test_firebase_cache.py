@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Test script for the Firestore channels cache: merges, reloads and the notify transaction.
+"""
+
+import importlib.util
+import os
+import sys
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.models.channel import Channel
+from src.services.firebase_service import MAX_WRITE_ATTEMPTS
+from test_firebase_batches import FakeDb, FakeRef, make_service, make_updates
+
+
+class FakeDoc:
+    def __init__(self, document_id: str, data: dict):
+        self.id = document_id
+        self._data = data
+
+    def to_dict(self) -> dict:
+        return dict(self._data)
+
+
+class FakeBulkWriter:
+    """Confirms every write on close, except for IDs that always fail."""
+
+    def __init__(self, failing_ids=()):
+        self.failing_ids = set(failing_ids)
+        self.sets = []
+
+    def on_write_result(self, callback):
+        self._on_result = callback
+
+    def on_write_error(self, callback):
+        self._on_error = callback
+
+    def set(self, ref, data, merge=False):
+        self.sets.append((ref, data, merge))
+
+    def close(self):
+        for ref, _, _ in self.sets:
+            if ref.id not in self.failing_ids:
+                self._on_result(ref, Mock(), self)
+                continue
+            attempts = 1
+            while self._on_error(Mock(attempts=attempts, message="unavailable",
+                                      operation=Mock(reference=ref)), self):
+                attempts += 1
+            assert attempts == MAX_WRITE_ATTEMPTS
+
+
+class StreamingDb(FakeDb):
+    """FakeDb whose subscriptions stream calls on_doc after yielding each document."""
+
+    def __init__(self, docs: list, on_doc=lambda doc: None):
+        super().__init__()
+        self._docs = docs
+        self._on_doc = on_doc
+
+    def collection(self, name: str):
+        collection = Mock()
+        collection.document.side_effect = lambda document_id: FakeRef(f"{name}/{document_id}")
+        collection.select.return_value.stream.side_effect = self._stream
+        return collection
+
+    def _stream(self):
+        for doc in self._docs:
+            yield doc
+            self._on_doc(doc)
+
+
+def test_merge_cached_channels():
+    """Test that merges only touch written fields and add fully written channels."""
+    print("Testing cache merges...")
+
+    channels, _ = make_updates(2)
+    service = make_service(FakeDb(), channels)
+    cached = channels[0]
+
+    service._merge_cached_channels([
+        ("UC0", {'title': "Renamed", 'thumbnail': "t.jpg"}),
+        ("UCnew", Channel(channel_id="UCnew", title="New").to_dict()),
+        ("UCpartial", {'notify': False}),
+    ])
+    result = {channel.channel_id: channel for channel in service.get_all_channels()}
+    # Updated in place, so pollers holding the cached object see the change
+    assert result["UC0"] is cached
+    assert (cached.title, cached.thumbnail, cached.last_video_id) == ("Renamed", "t.jpg", "old")
+    assert result["UCnew"].title == "New" and result["UCnew"].notify
+    assert "UCpartial" not in result
+    assert {"UCnew", "UCpartial"} <= service._known_channel_ids
+    print("✅ Only written fields are merged; full writes add channels")
+
+
+def test_bulk_writer_merge():
+    """Test that only confirmed bulk writes reach the cache."""
+    print("Testing bulk writer confirmations...")
+
+    channels, _ = make_updates(3)
+    db = FakeDb()
+    writer = db.bulk_writer = Mock(return_value=FakeBulkWriter(failing_ids={"UC1"}))
+    service = make_service(db, channels)
+
+    written = service.update_channel_fields_bulk(
+        (f"UC{i}", {'title': f"Renamed {i}"}) for i in range(3)
+    )
+    assert written == 2
+    assert all(merge for _, _, merge in writer.return_value.sets)
+    titles = [channel.title for channel in service.get_all_channels()]
+    assert titles == ["Renamed 0", "Channel 1", "Renamed 2"]
+    assert service.get_daily_stats()['writes'] == 2
+    print("✅ Failed writes are left out of the cache")
+
+
+def test_reload_journal():
+    """Test that writes made while a reload streams are re-applied to what it read."""
+    print("Testing reload write journal...")
+
+    docs = [FakeDoc(f"UC{i}", {'title': f"Channel {i}", 'last_video_id': "old"}) for i in range(2)]
+    service = make_service(FakeDb(), ())
+    service._cache_timestamp = None
+
+    def write_after_read(doc):
+        # A poll commits UC0's new video after the reload already read UC0
+        if doc.id == "UC0":
+            service._update_cached_channel("UC0", last_video_id="new")
+            service._merge_cached_channels([("UC9", Channel(channel_id="UC9", title="Added").to_dict())])
+
+    service._db = StreamingDb(docs, write_after_read)
+    channels = service._load_channels()
+    assert [(channel.channel_id, channel.last_video_id) for channel in channels] == [
+        ("UC0", "new"), ("UC1", "old"), ("UC9", "")
+    ]
+    assert service.get_all_channels() is channels
+    assert service._writes_during_reload == [] and service._reloads_in_flight == 0
+    print("✅ Concurrent writes survive the reload")
+
+    # Outside a reload nothing is journaled
+    service._update_cached_channel("UC1", last_video_id="newer")
+    assert service._writes_during_reload == []
+    print("✅ Writes are only journaled while a reload runs")
+
+
+def test_load_failure_flag():
+    """Test that a failed load is reported, so an empty result is not read as no channels."""
+    print("Testing channel load failures...")
+
+    service = make_service(FakeDb(), ())
+    service._cache_timestamp = None
+    service._db = StreamingDb([FakeDoc("UC0", {'title': "Channel 0"})])
+    service._db.collection = Mock(side_effect=RuntimeError("unavailable"))
+
+    assert service.get_all_channels() == ()
+    assert service.channels_load_failed
+    print("✅ A failed load is flagged")
+
+    service._db = StreamingDb([FakeDoc("UC0", {'title': "Channel 0"})])
+    assert len(service.get_all_channels()) == 1
+    assert not service.channels_load_failed
+    print("✅ The flag clears on the next successful load")
+
+    from test_polling import make_bot
+    bot_service = make_bot()
+    bot_service._firebase_service = Mock()
+    bot_service._firebase_service.get_all_channels.return_value = ()
+    bot_service._firebase_service.channels_load_failed = True
+    bot_service._youtube_service.get_user_channel_info.return_value = None
+    bot_service._send_startup_notification()
+    assert bot_service._telegram_service.send_startup_message.call_args.args[1] == "Unknown"
+
+    bot_service._firebase_service.channels_load_failed = False
+    bot_service._send_startup_notification()
+    assert bot_service._telegram_service.send_startup_message.call_args.args[1] == 0
+    print("✅ Startup message reports Unknown instead of 0 after a failed load")
+
+
+def test_update_and_return_channel():
+    """Test the notify toggle transaction and its cache update."""
+    print("Testing notify transaction...")
+
+    channels, _ = make_updates(1)
+    db = Mock()
+    snapshot = db.collection.return_value.document.return_value.get.return_value
+    snapshot.exists = True
+    snapshot.to_dict.return_value = {'title': "Channel 0", 'notify': True}
+    service = make_service(db, channels)
+
+    with patch('src.services.firebase_service.firestore') as firestore:
+        firestore.transactional = lambda function: function
+        channel = service.update_and_return_channel("UC0")
+
+        transaction = db.transaction.return_value
+        _, data = transaction.update.call_args.args
+        assert data == {'notify': False, 'last_updated': firestore.SERVER_TIMESTAMP}
+        assert channel.notify is False and channel.title == "Channel 0"
+        assert channels[0].notify is False
+        print("✅ Toggle reads and writes in one transaction and updates the cache")
+
+        assert service.update_and_return_channel("UC0", notify=True).notify is True
+
+        snapshot.exists = False
+        try:
+            service.update_and_return_channel("UC0")
+            assert False, "expected a missing channel to raise"
+        except KeyError:
+            pass
+    print("✅ Explicit values are set, missing channels raise")
+
+
+def load_remove_short():
+    spec = importlib.util.spec_from_file_location(
+        "remove_short", os.path.join(os.path.dirname(os.path.abspath(__file__)), "remove-short.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeVideoQuery:
+    """Applies FieldFilter range filters to in-memory video documents."""
+
+    OPERATORS = {
+        '<': lambda a, b: a < b,
+        '>=': lambda a, b: a >= b,
+    }
+
+    def __init__(self, docs: list, filters=()):
+        self._docs = docs
+        self._filters = list(filters)
+
+    def where(self, filter):
+        return FakeVideoQuery(self._docs, self._filters + [filter])
+
+    def _matches(self) -> list:
+        return [doc for doc in self._docs
+                if all('link' in doc._data and self.OPERATORS[f.op_string](doc._data[f.field_path], f.value)
+                       for f in self._filters)]
+
+    def count(self):
+        return Mock(get=Mock(return_value=[[Mock(value=len(self._matches()))]]))
+
+    def select(self, fields):
+        assert fields == ['link', 'title']
+        return Mock(stream=Mock(return_value=iter(self._matches())))
+
+
+def test_remove_short_scan():
+    """Test that full videos are only counted and shorts are the only documents read."""
+    print("Testing remove-short scan...")
+
+    remove_short = load_remove_short()
+    docs = [
+        FakeDoc("full1", {'link': "https://www.youtube.com/watch?v=a", 'title': "A"}),
+        FakeDoc("full2", {'link': "https://www.youtube.com/watch?v=b", 'title': "B"}),
+        FakeDoc("short", {'link': "https://www.youtube.com/shorts/c", 'title': "C"}),
+        FakeDoc("other", {'link': "https://youtu.be/d", 'title': "D"}),
+        FakeDoc("nolink", {'title': "E"}),
+    ]
+    service = Mock(_db=Mock())
+    service._db.collection.return_value = FakeVideoQuery(docs)
+
+    total, full_count, shorts = remove_short.scan_videos(service)
+    assert (total, full_count) == (4, 2)
+    assert sorted(video['doc_id'] for video in shorts) == ["other", "short"]
+    print("✅ Full videos counted server-side, shorts listed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Testing Firestore Channels Cache")
+    print("=" * 60)
+
+    try:
+        test_merge_cached_channels()
+        test_bulk_writer_merge()
+        test_reload_journal()
+        test_load_failure_flag()
+        test_update_and_return_channel()
+        test_remove_short_scan()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! Channels cache is working correctly.")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for the cron scheduler loop and its shutdown handling.
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from test_polling import make_bot
+
+
+def test_stop_ends_scheduler():
+    """Test that stop() wakes the scheduler loop and returns from it."""
+    print("Testing scheduler stop...")
+
+    bot_service = make_bot()
+    loop = threading.Thread(target=bot_service._run_scheduler, daemon=True)
+    loop.start()
+    time.sleep(0.2)
+    assert loop.is_alive()
+    assert len(bot_service._scheduler.queue) == 3
+
+    bot_service.stop()
+    loop.join(timeout=2)
+    assert not loop.is_alive()
+    assert bot_service._scheduler.empty()
+    print("✅ Scheduler loop exits on stop()")
+
+    # Nothing is queued once stopped
+    bot_service._schedule_lease_renewal()
+    assert bot_service._scheduler.empty()
+    bot_service._shutdown()
+    print("✅ Stopped scheduler queues no more runs")
+
+
+def test_schedules_start_at_scheduler_start():
+    """Test that schedules compiled long before start still fire in the future, in the cron zone."""
+    print("Testing cron seeding...")
+
+    with patch.dict(os.environ, {'CRON_TIMEZONE': 'Asia/Shanghai'}):
+        bot_service = make_bot()
+    bot_service._config.validate()
+    # As if validate() ran long before the scheduler started
+    for cron in (bot_service._config.video_cron_iter, bot_service._config.channel_cron_iter,
+                 bot_service._config.summary_cron_iter):
+        cron.set_current(datetime(2020, 1, 1, tzinfo=timezone.utc), force=True)
+
+    bot_service._scheduler.run = Mock()
+    with patch('src.services.bot_service.logger') as logger:
+        bot_service._run_scheduler()
+
+    now = time.time()
+    assert bot_service._config.video_cron_iter.get_current(float) > now
+    assert bot_service._config.summary_cron_iter.get_current(float) > now
+    logged = [call.args[-1] for call in logger.info.call_args_list]
+    assert len(logged) == 3 and all(str(when).endswith("+08:00") for when in logged)
+    bot_service._shutdown()
+    print("✅ Schedules start from the scheduler's start, logged in the cron zone")
+
+
+def test_overlapping_runs_skipped():
+    """Test that a job is not started again while its previous run is still going."""
+    print("Testing overlapping job runs...")
+
+    bot_service = make_bot()
+    release = threading.Event()
+    runs = []
+
+    def job():
+        runs.append(time.time())
+        release.wait(timeout=2)
+
+    bot_service._submit_job(job, "video", "video poll")
+    bot_service._submit_job(job, "video", "video poll")
+    release.set()
+    bot_service._running_jobs["video"].result(timeout=2)
+    assert len(runs) == 1
+
+    bot_service._submit_job(job, "video", "video poll")
+    bot_service._running_jobs["video"].result(timeout=2)
+    assert len(runs) == 2
+    bot_service._shutdown()
+    print("✅ A run is skipped while the previous one is in progress")
+
+
+def test_signal_handlers():
+    """Test that SIGTERM and SIGINT are turned into stop()."""
+    print("Testing signal handlers...")
+
+    bot_service = make_bot()
+    previous = {signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        bot_service._install_signal_handlers()
+        signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+        assert bot_service._stop_event.is_set()
+
+        other = make_bot()
+        other._install_signal_handlers()
+        signal.getsignal(signal.SIGINT)(signal.SIGINT, None)
+        assert other._stop_event.is_set()
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+    print("✅ SIGTERM and SIGINT stop the bot")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Testing Scheduler")
+    print("=" * 60)
+
+    try:
+        test_stop_ends_scheduler()
+        test_schedules_start_at_scheduler_start()
+        test_overlapping_runs_skipped()
+        test_signal_handlers()
+
+        print("\n" + "=" * 60)
+        print("🎉 ALL TESTS PASSED! Scheduler is working correctly.")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)